@@ -21,3 +21,7 @@ class SearchEngine(enum.Enum):
 SELECTED_SEARCH_ENGINE = os.getenv("SEARCH_API", SearchEngine.TAVILY.value)
 CRAWLER_TYPE = os.getenv("CRAWLER_TYPE", "jina")
 CRAWL4AI_URL = os.getenv("CRAWL4AI_URL")
+# Set DEER_CRAWL_CACHE=0 to disable the in-process crawl result cache
+CRAWL_CACHE_ENABLED = os.getenv("DEER_CRAWL_CACHE", "1") != "0"
+# Set DEER_TAVILY_CACHE=0 to disable the in-process Tavily search result cache
+TAVILY_CACHE_ENABLED = os.getenv("DEER_TAVILY_CACHE", "1") != "0"
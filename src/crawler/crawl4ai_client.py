@@ -2,16 +2,248 @@
 # SPDX-License-Identifier: MIT
 
 import logging
-import requests
-import json
+
+import httpx
+import orjson
+
+from src.utils.http_client import LoopBoundAsyncClient
 
 logger = logging.getLogger(__name__)
 
+_BASE_HEADERS = {"Content-Type": "application/json"}
+
+# Crawls routinely take as long as the 30s page-load budget in the payload
+# options, so leave headroom on reads while failing fast on connects
+_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# Social media domains crawl4ai should not follow; immutable so the shared
+# payload template cannot be mutated by accident
+_SOCIAL_BLOCK = (
+    "facebook.com",
+    "twitter.com",
+    "x.com",
+    "linkedin.com",
+    "instagram.com",
+    "pinterest.com",
+    "tiktok.com",
+    "snapchat.com",
+    "reddit.com",
+)
+
+# Static part of the request payload, formatted according to the crawl4ai API
+# requirements. Per-request fields ("urls", "format") are filled in by
+# Crawl4aiClient._build_request; treat this template as read-only.
+_BASE_PAYLOAD: dict = {
+    "crawler_config": {
+        "type": "CrawlerRunConfig",
+        "params": {
+            "scraping_strategy": {
+                "type": "WebScrapingStrategy",
+                "params": {}
+            },
+            "exclude_social_media_domains": _SOCIAL_BLOCK
+        }
+    },
+    "options": {
+        "wait_for": ["domcontentloaded", "networkidle0"],  # Wait for page to load completely
+        "timeout": 30000  # 30 seconds timeout
+    }
+}
+
 
 class Crawl4aiClient:
     def __init__(self, base_url: str):
         self.base_url = base_url
-        logger.info(f"Initialized Crawl4aiClient with base URL: {base_url}")
+        # Pooled keep-alive HTTP/2 connections shared by every sync crawl
+        self._http = httpx.Client(
+            transport=httpx.HTTPTransport(http2=True, limits=_LIMITS, retries=3),
+            timeout=_TIMEOUT,
+        )
+        # Created lazily on first async crawl so it binds to the running loop
+        self._session = LoopBoundAsyncClient(
+            lambda: httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(http2=True, limits=_LIMITS, retries=3),
+                timeout=_TIMEOUT,
+            )
+        )
+        logger.info("Initialized Crawl4aiClient with base URL: %s", base_url)
+
+    def close(self) -> None:
+        """Close the pooled sync HTTP client."""
+        self._http.close()
+
+    def __enter__(self) -> "Crawl4aiClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        http = getattr(self, "_http", None)
+        if http is not None:
+            http.close()
+
+    async def aclose(self) -> None:
+        """Close the shared async HTTP client, if one was opened."""
+        await self._session.aclose()
+
+    def _build_request(self, urls: list[str], return_format: str, **kwargs) -> tuple[dict, dict]:
+        """Build the headers and payload for a crawl4ai request."""
+        headers = {**_BASE_HEADERS, "X-Return-Format": return_format}
+        data = {**_BASE_PAYLOAD, "urls": urls, "format": return_format}
+
+        # Add any additional parameters from kwargs to the options without
+        # mutating the shared template
+        if kwargs:
+            data["options"] = {**_BASE_PAYLOAD["options"], **kwargs}
+
+        return headers, data
+
+    @staticmethod
+    def _content_of(item):
+        """Return ``item["content"]`` if ``item`` is a dict carrying it, else None."""
+        return item.get("content") if isinstance(item, dict) else None
+
+    def _extract_content(self, json_response, url: str) -> str:
+        """Unwrap the crawled content for ``url`` from a crawl4ai JSON response."""
+        # Common single-URL case: the content field is at the top level
+        content = self._content_of(json_response)
+        if content is not None:
+            return content
+
+        # Handle response for multiple URLs (API might return an array or object with URL keys)
+        if isinstance(json_response, dict):
+            results = json_response.get("results")
+            if isinstance(results, dict) and results:
+                # Prefer the result for our specific URL, otherwise fall back to the first one
+                result = results.get(url)
+                if result is None:
+                    result = next(iter(results.values()))
+                content = self._content_of(result)
+                return content if content is not None else orjson.dumps(result).decode()
+        # If the response is an array, return the first item's content if available
+        elif isinstance(json_response, list) and json_response:
+            first_item = json_response[0]
+            content = self._content_of(first_item)
+            return content if content is not None else orjson.dumps(first_item).decode()
+
+        # If there's no recognizable structure, return the entire JSON response as a string
+        return orjson.dumps(json_response).decode()
+
+    def _demux_results(self, json_response) -> dict[str, str]:
+        """Map each URL in a multi-URL crawl4ai response to its crawled content."""
+        results = json_response.get("results") if isinstance(json_response, dict) else json_response
+        # Results are either keyed by URL or a list of items carrying their URL
+        if isinstance(results, dict):
+            items = results.items()
+        elif isinstance(results, list):
+            items = ((item.get("url"), item) for item in results if isinstance(item, dict))
+        else:
+            return {}
+
+        contents = {}
+        for url, result in items:
+            content = self._content_of(result)
+            contents[url] = content if content is not None else orjson.dumps(result).decode()
+        return contents
+
+    def crawl_many(self, urls: list[str], return_format: str = "text", **kwargs) -> dict[str, str]:
+        """
+        Crawl several URLs with a single request to the crawl4ai service.
+
+        URLs missing from the batch response, or all of them if the batch
+        request fails, are crawled individually with :meth:`crawl`.
+
+        Args:
+            urls: The URLs to crawl
+            return_format: The desired return format (text or html)
+            **kwargs: Additional parameters to pass to the crawl4ai service
+
+        Returns:
+            A mapping from each URL to its crawled content
+        """
+        if not urls:
+            return {}
+
+        headers, data = self._build_request(list(urls), return_format, **kwargs)
+        logger.info("Making batch POST request to %s for %d URLs", self.base_url, len(urls))
+
+        try:
+            response = self._http.post(self.base_url, headers=headers, content=orjson.dumps(data))
+            response.raise_for_status()
+            contents = self._demux_results(orjson.loads(response.content))
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.warning("Batch crawl request failed, crawling URLs individually: %r", e)
+            contents = {}
+
+        for url in urls:
+            if url not in contents:
+                contents[url] = self.crawl(url, return_format, **kwargs)
+        return {url: contents[url] for url in urls}
+
+    async def crawl_async(self, url: str, return_format: str = "text", **kwargs) -> str:
+        """
+        Crawl a URL using the crawl4ai service without blocking the event loop.
+
+        Uses a shared HTTP/2 client so concurrent crawls multiplex over
+        pooled connections and can be fanned out with ``asyncio.gather``.
+
+        Args:
+            url: The URL to crawl
+            return_format: The desired return format (text or html)
+            **kwargs: Additional parameters to pass to the crawl4ai service
+
+        Returns:
+            The crawled content as a string
+        """
+        headers, data = self._build_request([url], return_format, **kwargs)
+        session = self._session.get()
+
+        logger.info(
+            "Making async POST request to %s for URL: %s with format: %s",
+            self.base_url, url, return_format,
+        )
+
+        try:
+            response = await session.post(self.base_url, headers=headers, content=orjson.dumps(data))
+            logger.info("Response status code: %s", response.status_code)
+            if response.status_code == 422:
+                logger.error("422 Unprocessable Entity error. Response content (first 512 chars): %s...", response.text[:512])
+                logger.info("Attempting fallback with simpler payload...")
+                fallback_response = await session.post(self.base_url, headers=headers, content=orjson.dumps({"urls": [url]}))
+                if fallback_response.status_code != 200:
+                    logger.error("Fallback request failed with status code: %s", fallback_response.status_code)
+                    raise RuntimeError(f"422 Unprocessable Entity error from crawl4ai: {response.text}")
+                logger.info("Fallback request succeeded!")
+                response = fallback_response
+
+            response.raise_for_status()
+            logger.info("Successfully received response from crawl4ai for URL: %s", url)
+
+        except httpx.HTTPError as e:
+            error_msg = f"Error making request to crawl4ai: {str(e)}"
+            logger.error(error_msg)
+
+            # Same fallback as crawl: retry once with the simplest payload
+            try:
+                logger.info("Attempting fallback with simpler payload after connection error...")
+                fallback_response = await session.post(self.base_url, headers=_BASE_HEADERS, content=orjson.dumps({"urls": [url]}))
+            except httpx.HTTPError as fallback_error:
+                logger.error("Fallback request also failed: %s", fallback_error)
+                raise RuntimeError(error_msg) from e
+            if fallback_response.status_code != 200:
+                logger.error("Fallback request failed with status code: %s", fallback_response.status_code)
+                raise RuntimeError(error_msg) from e
+            logger.info("Fallback request succeeded!")
+            response = fallback_response
+
+        try:
+            json_response = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            logger.info("Response is not JSON, returning raw text")
+            return response.text
+        return self._extract_content(json_response, url)
 
     def crawl(self, url: str, return_format: str = "text", **kwargs) -> str:
         """
@@ -25,118 +257,55 @@ class Crawl4aiClient:
         Returns:
             The crawled content as a string
         """
-        headers = {
-            "Content-Type": "application/json",
-            "X-Return-Format": return_format,  # Add return format header like JinaClient
-        }
+        headers, data = self._build_request([url], return_format, **kwargs)
         
-        # Prepare the request payload
-        # Format the request payload according to the crawl4ai API requirements
-        data = {
-            "urls": [url],  # API expects an array of URLs
-            "crawler_config": {
-                "type": "CrawlerRunConfig",
-                "params": {
-                    "scraping_strategy": {
-                        "type": "WebScrapingStrategy",
-                        "params": {}
-                    },
-                    "exclude_social_media_domains": [
-                        "facebook.com",
-                        "twitter.com",
-                        "x.com",
-                        "linkedin.com",
-                        "instagram.com",
-                        "pinterest.com",
-                        "tiktok.com",
-                        "snapchat.com",
-                        "reddit.com"
-                    ]
-                }
-            },
-            "format": return_format,  # Include format in the payload
-            "options": {
-                "wait_for": ["domcontentloaded", "networkidle0"],  # Wait for page to load completely
-                "timeout": 30000  # 30 seconds timeout
-            }
-        }
-        
-        # Add any additional parameters from kwargs to the options
-        if kwargs:
-            data["options"].update(kwargs)
-        
-        logger.info(f"Making POST request to {self.base_url} for URL: {url} with format: {return_format}")
+        logger.info(
+            "Making POST request to %s for URL: %s with format: %s",
+            self.base_url, url, return_format,
+        )
         
         try:
-            response = requests.post(self.base_url, headers=headers, json=data)
+            response = self._http.post(self.base_url, headers=headers, content=orjson.dumps(data))
             
             # Log the response status code and headers for debugging
-            logger.info(f"Response status code: {response.status_code}")
-            logger.info(f"Response headers: {response.headers}")
+            logger.info("Response status code: %s", response.status_code)
+            logger.info("Response headers: %s", response.headers)
             
             # If we get a 422 error, log the response content for debugging
             if response.status_code == 422:
-                logger.error(f"422 Unprocessable Entity error. Response content (first 100 chars): {str(response.text)[:100]}...")
-                logger.error(f"Request payload: {data}")
+                logger.error("422 Unprocessable Entity error. Response content (first 512 chars): %s...", response.text[:512])
+                logger.error("Request payload urls=%s keys=%s", data["urls"], list(data))
                 # Try with a simpler payload as a fallback
                 logger.info("Attempting fallback with simpler payload...")
                 fallback_data = {"urls": [url]}
-                fallback_response = requests.post(self.base_url, headers=headers, json=fallback_data)
+                fallback_response = self._http.post(self.base_url, headers=headers, content=orjson.dumps(fallback_data))
                 if fallback_response.status_code == 200:
                     logger.info("Fallback request succeeded!")
                     response = fallback_response
                 else:
-                    logger.error(f"Fallback request failed with status code: {fallback_response.status_code}")
-                    logger.error(f"Fallback response content (first 100 chars): {str(fallback_response.text)[:100]}...")
+                    logger.error("Fallback request failed with status code: %s", fallback_response.status_code)
+                    logger.error("Fallback response content (first 512 chars): %s...", fallback_response.text[:512])
                     raise RuntimeError(f"422 Unprocessable Entity error from crawl4ai: {response.text}")
             
             # Check if the request was successful
             response.raise_for_status()
             
-            logger.info(f"Successfully received response from crawl4ai for URL: {url}")
+            logger.info("Successfully received response from crawl4ai for URL: %s", url)
             
             # Try to parse the response as JSON
             try:
-                json_response = response.json()
-                logger.info(f"Response structure (first 100 chars): {json.dumps(json_response)[:100]}...")
+                # The body is buffered once as bytes and parsed in place; log its
+                # size rather than re-serializing the parsed tree for a snippet
+                json_response = orjson.loads(response.content)
+                logger.info("Response body length: %s bytes", response.headers.get("Content-Length", len(response.content)))
                 
-                # Handle response for multiple URLs (API might return an array or object with URL keys)
-                if isinstance(json_response, dict):
-                    # If the response is for a single URL or has a content field directly
-                    if "content" in json_response:
-                        return json_response["content"]
-                    # If the response contains results for each URL
-                    elif "results" in json_response and isinstance(json_response["results"], dict):
-                        # Try to get the result for our specific URL
-                        if url in json_response["results"]:
-                            result = json_response["results"][url]
-                            if isinstance(result, dict) and "content" in result:
-                                return result["content"]
-                            return json.dumps(result)
-                        # If URL not found in results, return the first result's content if available
-                        elif json_response["results"] and len(json_response["results"]) > 0:
-                            first_url = list(json_response["results"].keys())[0]
-                            first_result = json_response["results"][first_url]
-                            if isinstance(first_result, dict) and "content" in first_result:
-                                return first_result["content"]
-                            return json.dumps(first_result)
-                    # If the response has a different structure, return the entire JSON
-                    return json.dumps(json_response)
-                # If the response is an array, return the first item's content if available
-                elif isinstance(json_response, list) and len(json_response) > 0:
-                    first_item = json_response[0]
-                    if isinstance(first_item, dict) and "content" in first_item:
-                        return first_item["content"]
-                    return json.dumps(first_item)
-                else:
-                    # If there's no recognizable structure, return the entire JSON response as a string
-                    return json.dumps(json_response)
-            except json.JSONDecodeError:
+                return self._extract_content(json_response, url)
+            except orjson.JSONDecodeError:
                 # If the response is not JSON, return the raw text
                 logger.info("Response is not JSON, returning raw text")
                 return response.text
                 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             error_msg = f"Error making request to crawl4ai: {str(e)}"
             logger.error(error_msg)
             
@@ -145,42 +314,19 @@ class Crawl4aiClient:
                 logger.info("Attempting fallback with simpler payload after connection error...")
                 fallback_data = {"urls": [url]}
                 fallback_headers = {"Content-Type": "application/json"}
-                fallback_response = requests.post(self.base_url, headers=fallback_headers, json=fallback_data)
+                fallback_response = self._http.post(self.base_url, headers=fallback_headers, content=orjson.dumps(fallback_data))
                 if fallback_response.status_code == 200:
                     logger.info("Fallback request succeeded!")
                     try:
-                        json_response = fallback_response.json()
-                        logger.info(f"Fallback response structure (first 100 chars): {json.dumps(json_response)[:100]}...")
+                        json_response = orjson.loads(fallback_response.content)
+                        logger.info("Fallback response body length: %s bytes", fallback_response.headers.get("Content-Length", len(fallback_response.content)))
                         
-                        # Handle fallback response for multiple URLs (similar logic as above)
-                        if isinstance(json_response, dict):
-                            if "content" in json_response:
-                                return json_response["content"]
-                            elif "results" in json_response and isinstance(json_response["results"], dict):
-                                if url in json_response["results"]:
-                                    result = json_response["results"][url]
-                                    if isinstance(result, dict) and "content" in result:
-                                        return result["content"]
-                                    return json.dumps(result)
-                                elif json_response["results"] and len(json_response["results"]) > 0:
-                                    first_url = list(json_response["results"].keys())[0]
-                                    first_result = json_response["results"][first_url]
-                                    if isinstance(first_result, dict) and "content" in first_result:
-                                        return first_result["content"]
-                                    return json.dumps(first_result)
-                            return json.dumps(json_response)
-                        elif isinstance(json_response, list) and len(json_response) > 0:
-                            first_item = json_response[0]
-                            if isinstance(first_item, dict) and "content" in first_item:
-                                return first_item["content"]
-                            return json.dumps(first_item)
-                        else:
-                            return json.dumps(json_response)
-                    except json.JSONDecodeError:
+                        return self._extract_content(json_response, url)
+                    except orjson.JSONDecodeError:
                         return fallback_response.text
                 else:
-                    logger.error(f"Fallback request failed with status code: {fallback_response.status_code}")
-            except requests.exceptions.RequestException as fallback_error:
-                logger.error(f"Fallback request also failed: {str(fallback_error)}")
+                    logger.error("Fallback request failed with status code: %s", fallback_response.status_code)
+            except httpx.HTTPError as fallback_error:
+                logger.error("Fallback request also failed: %s", fallback_error)
             
             raise RuntimeError(error_msg)
\ No newline at end of file
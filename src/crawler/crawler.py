@@ -1,6 +1,7 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import sys
 import logging
 import os
@@ -14,35 +15,75 @@ from src.config.tools import CRAWLER_TYPE, CRAWL4AI_URL
 logger = logging.getLogger(__name__)
 
 
+def _make_client():
+    """Select the crawler client from configuration, once at import time."""
+    if CRAWLER_TYPE == "crawl4ai":
+        if CRAWL4AI_URL:
+            logger.info(f"Using Crawl4ai client with URL: {CRAWL4AI_URL}")
+            return Crawl4aiClient(CRAWL4AI_URL)
+        logger.warning("CRAWL4AI_URL is not set. Falling back to Jina.")
+    # Default to Jina
+    logger.info("Using Jina client")
+    return JinaClient()
+
+
+# Shared process-wide so the crawl4ai connection pool stays warm across calls
+_CLIENT = _make_client()
+_EXTRACTOR = ReadabilityExtractor()
+
+
 class Crawler:
+    def __init__(self):
+        self._client = _CLIENT
+        self._extractor = _EXTRACTOR
+
     def crawl(self, url: str) -> Article:
         # To help LLMs better understand content, we extract clean
         # articles from HTML, convert them to markdown, and split
         # them into text and image blocks for one single and unified
         # LLM message.
-        #
-        # Select the crawler based on configuration
-        if CRAWLER_TYPE == "crawl4ai":
-            if not CRAWL4AI_URL:
-                logger.warning("CRAWL4AI_URL is not set. Falling back to Jina.")
-                client = JinaClient()
-            else:
-                logger.info(f"Using Crawl4ai client with URL: {CRAWL4AI_URL}")
-                client = Crawl4aiClient(CRAWL4AI_URL)
-        else:
-            # Default to Jina
-            logger.info("Using Jina client")
-            client = JinaClient()
-            
+        logger.debug("Using %s for URL: %s", type(self._client).__name__, url)
+
         # Get HTML content from the selected crawler
-        html = client.crawl(url, return_format="html")
+        html = self._client.crawl(url, return_format="html")
         
         # Use our readability extractor to process the HTML
-        extractor = ReadabilityExtractor()
-        article = extractor.extract_article(html)
+        article = self._extractor.extract_article(html)
         article.url = url
         return article
 
+    async def acrawl(self, url: str) -> Article:
+        """Async variant of :meth:`crawl` that does not block the event loop."""
+        logger.debug("Using %s for URL: %s", type(self._client).__name__, url)
+
+        if isinstance(self._client, Crawl4aiClient):
+            html = await self._client.crawl_async(url, return_format="html")
+        else:
+            html = await asyncio.to_thread(self._client.crawl, url, return_format="html")
+
+        # Readability extraction is CPU-bound, keep it off the event loop
+        article = await asyncio.to_thread(self._extractor.extract_article, html)
+        article.url = url
+        return article
+
+    def crawl_many(self, urls: list[str]) -> dict[str, Article]:
+        """Crawl several URLs, batching them into one request when the client supports it."""
+        if isinstance(self._client, Crawl4aiClient):
+            html_by_url = self._client.crawl_many(urls, return_format="html")
+        else:
+            html_by_url = {url: self._client.crawl(url, return_format="html") for url in urls}
+
+        articles = {}
+        for url, html in html_by_url.items():
+            article = self._extractor.extract_article(html)
+            article.url = url
+            articles[url] = article
+        return articles
+
+    async def acrawl_many(self, urls: list[str]) -> dict[str, Article]:
+        """Async variant of :meth:`crawl_many` that does not block the event loop."""
+        return await asyncio.to_thread(self.crawl_many, urls)
+
 
 if __name__ == "__main__":
     if len(sys.argv) == 2:
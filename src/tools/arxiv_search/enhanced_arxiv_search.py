@@ -1,106 +1,196 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import json
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 
 from langchain.callbacks.manager import CallbackManagerForToolRun, AsyncCallbackManagerForToolRun
 from langchain_community.tools.arxiv import ArxivQueryRun
 from langchain_community.utilities import ArxivAPIWrapper
+from langchain_core.documents import Document
+from pydantic import PrivateAttr
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent paper downloads, kept low to respect arXiv rate limits
+_LOAD_MAX_WORKERS = 8
+
 
 class EnhancedArxivAPIWrapper(ArxivAPIWrapper):
     """Enhanced Arxiv API wrapper with detailed logging."""
     
     def run(self, query: str) -> str:
         """Run Arxiv search with detailed logging."""
-        logger.debug(f"ArxivAPI: Preparing request for query: '{query}'")
+        logger.debug("ArxivAPI: Preparing request for query: '%s'", query)
         
         # Log search parameters
-        logger.debug(f"ArxivAPI: Using parameters - top_k_results: {self.top_k_results}, load_max_docs: {self.load_max_docs}, load_all_available_meta: {self.load_all_available_meta}")
+        logger.debug(
+            "ArxivAPI: Using parameters - top_k_results: %s, load_max_docs: %s, load_all_available_meta: %s",
+            self.top_k_results,
+            self.load_max_docs,
+            self.load_all_available_meta,
+        )
         
         # Measure API call time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Call the API
-            logger.debug(f"ArxivAPI: Sending request to Arxiv API")
+            logger.debug("ArxivAPI: Sending request to Arxiv API")
             results = super().run(query)
             
-            api_time = time.time() - start_time
-            logger.debug(f"ArxivAPI: Request completed in {api_time:.3f} seconds")
+            api_time = time.perf_counter() - start_time
+            logger.debug("ArxivAPI: Request completed in %.3f seconds", api_time)
             
             # Log results size
-            logger.debug(f"ArxivAPI: Received response of length {len(results)} characters")
+            logger.debug("ArxivAPI: Received response of length %s characters", len(results))
             
             return results
             
         except Exception as e:
-            logger.error(f"ArxivAPI: Request failed with error: {repr(e)}")
+            logger.error("ArxivAPI: Request failed with error: %r", e)
             raise
     
-    def load(self, query: str) -> List[Dict]:
-        """Load raw data from Arxiv with detailed logging."""
-        logger.debug(f"ArxivAPI: Loading raw data for query: '{query}'")
+    def _fetch_one(self, result: Any) -> Optional[Document]:
+        """Download one search result's PDF and turn it into a Document."""
+        import fitz
+
+        try:
+            doc_file_name: str = result.download_pdf()
+            with fitz.open(doc_file_name) as doc_file:
+                text: str = "".join(page.get_text() for page in doc_file)
+        except (FileNotFoundError, fitz.FileDataError) as f_ex:
+            logger.debug("ArxivAPI: Skipping paper %s: %r", result.entry_id, f_ex)
+            return None
+        except Exception as e:
+            if self.continue_on_failure:
+                logger.error("ArxivAPI: Failed to load paper %s: %r", result.entry_id, e)
+                return None
+            raise
+
+        if self.load_all_available_meta:
+            extra_metadata = {
+                "entry_id": result.entry_id,
+                "published_first_time": str(result.published.date()),
+                "comment": result.comment,
+                "journal_ref": result.journal_ref,
+                "doi": result.doi,
+                "primary_category": result.primary_category,
+                "categories": result.categories,
+                "links": [link.href for link in result.links],
+            }
+        else:
+            extra_metadata = {}
+        metadata = {
+            "Published": str(result.updated.date()),
+            "Title": result.title,
+            "Authors": ", ".join(a.name for a in result.authors),
+            "Summary": result.summary,
+            **extra_metadata,
+        }
+        os.remove(doc_file_name)
+        return Document(page_content=text[: self.doc_content_chars_max], metadata=metadata)
+
+    def load(self, query: str) -> List[Document]:
+        """Load raw data from Arxiv with detailed logging.
+
+        Mirrors ``ArxivAPIWrapper.lazy_load`` but downloads and parses the
+        matching papers concurrently instead of one after another.
+        """
+        logger.debug("ArxivAPI: Loading raw data for query: '%s'", query)
         
+        try:
+            import fitz  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "PyMuPDF package not found, please install it with "
+                "`pip install pymupdf`"
+            )
+
         # Measure API call time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Call the API
-            logger.debug(f"ArxivAPI: Fetching papers from Arxiv")
-            docs = super().load(query)
+            logger.debug("ArxivAPI: Fetching papers from Arxiv")
+            # Remove the ":" and "-" from the query, as they can cause search problems
+            query = query.replace(":", "").replace("-", "")
+            if self.is_arxiv_identifier(query):
+                search = self.arxiv_search(
+                    id_list=query[: self.ARXIV_MAX_QUERY_LENGTH].split(),
+                    max_results=self.load_max_docs,
+                )
+            else:
+                search = self.arxiv_search(
+                    query[: self.ARXIV_MAX_QUERY_LENGTH], max_results=self.load_max_docs
+                )
+            results = list(search.results())
+        except self.arxiv_exceptions as ex:
+            logger.debug("ArxivAPI: Error on arxiv: %r", ex)
+            return []
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=_LOAD_MAX_WORKERS, thread_name_prefix="arxiv-load"
+            ) as executor:
+                docs = [doc for doc in executor.map(self._fetch_one, results) if doc is not None]
             
-            api_time = time.time() - start_time
-            logger.debug(f"ArxivAPI: Data loading completed in {api_time:.3f} seconds")
+            api_time = time.perf_counter() - start_time
+            logger.debug("ArxivAPI: Data loading completed in %.3f seconds", api_time)
             
             # Log results
-            logger.debug(f"ArxivAPI: Loaded {len(docs)} papers")
+            logger.debug("ArxivAPI: Loaded %s papers", len(docs))
             
             return docs
             
         except Exception as e:
-            logger.error(f"ArxivAPI: Data loading failed with error: {repr(e)}")
+            logger.error("ArxivAPI: Data loading failed with error: %r", e)
             raise
 
 
 class EnhancedArxivQueryRun(ArxivQueryRun):
     """Enhanced Arxiv search tool with detailed internal logging."""
 
+    # Whether api_wrapper is our enhanced wrapper; checked once at construction
+    _wrapper_is_enhanced: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        self._wrapper_is_enhanced = isinstance(self.api_wrapper, EnhancedArxivAPIWrapper)
+        if not self._wrapper_is_enhanced:
+            logger.warning("ArxivSearch: Not using EnhancedArxivAPIWrapper, logging will be limited")
+
     def _run(
         self,
         query: str,
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> str:
         """Run Arxiv search with detailed logging."""
-        logger.info(f"ArxivSearch: Starting search for query: '{query}'")
+        logger.info("ArxivSearch: Starting search for query: '%s'", query)
         
         try:
-            # Ensure we're using our enhanced wrapper
-            if not isinstance(self.api_wrapper, EnhancedArxivAPIWrapper):
-                logger.warning("ArxivSearch: Not using EnhancedArxivAPIWrapper, logging will be limited")
-            
             # Measure execution time
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # Get search results
-            logger.info(f"ArxivSearch: Calling Arxiv API")
+            logger.info("ArxivSearch: Calling Arxiv API")
             results = self.api_wrapper.run(query)
             
-            api_time = time.time() - start_time
-            logger.info(f"ArxivSearch: API call completed in {api_time:.3f} seconds")
+            api_time = time.perf_counter() - start_time
+            logger.info("ArxivSearch: API call completed in %.3f seconds", api_time)
             
             # Log results size
-            logger.info(f"ArxivSearch: Received response of length {len(results)} characters")
+            logger.info("ArxivSearch: Received response of length %s characters", len(results))
             
             return results
             
         except Exception as e:
-            logger.error(f"ArxivSearch: Search failed with error: {repr(e)}")
+            logger.error("ArxivSearch: Search failed with error: %r", e)
             raise
 
     async def _arun(
@@ -110,11 +200,11 @@ class EnhancedArxivQueryRun(ArxivQueryRun):
     ) -> str:
         """Run Arxiv search asynchronously with detailed logging."""
         # Note: ArxivQueryRun doesn't have a native async implementation
-        # We're implementing this to maintain consistency with other search tools
-        logger.info(f"ArxivSearch (async): Starting search for query: '{query}'")
-        logger.info(f"ArxivSearch (async): Note - Using synchronous implementation as async is not natively supported")
+        logger.info("ArxivSearch (async): Starting search for query: '%s'", query)
+        logger.info("ArxivSearch (async): Note - Running synchronous implementation in a worker thread")
         
-        return self._run(query, run_manager)
+        # Search and PDF loading block, so run them in a worker thread
+        return await asyncio.to_thread(self._run, query, run_manager)
 
 
 if __name__ == "__main__":
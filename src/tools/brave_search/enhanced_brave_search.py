@@ -1,24 +1,37 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import json
 import logging
 import time
 from typing import Dict, List, Optional, Any
 
+import httpx
+import orjson
 from langchain.callbacks.manager import CallbackManagerForToolRun, AsyncCallbackManagerForToolRun
 from langchain_community.tools import BraveSearch
 from langchain_community.utilities import BraveSearchWrapper
+from pydantic import PrivateAttr
 
 logger = logging.getLogger(__name__)
 
+BRAVE_SEARCH_API_URL = "https://api.search.brave.com/res/v1/web/search"
+
+# Shared keep-alive HTTP/2 connection pool for every Brave search in the process
+_client = httpx.Client(
+    http2=True,
+    timeout=httpx.Timeout(10.0, connect=3.05),
+    limits=httpx.Limits(max_keepalive_connections=16),
+)
+
 
 class EnhancedBraveSearchWrapper(BraveSearchWrapper):
     """Enhanced Brave Search API wrapper with detailed logging."""
     
     def run(self, query: str, count: Optional[int] = None, **kwargs: Any) -> List[Dict]:
         """Run Brave search with detailed logging."""
-        logger.debug(f"BraveAPI: Preparing request for query: '{query}'")
+        logger.debug("BraveAPI: Preparing request for query: '%s'", query)
         
         # Get the count from search_kwargs if not provided directly
         search_kwargs = getattr(self, "search_kwargs", {}) or {}
@@ -26,86 +39,102 @@ class EnhancedBraveSearchWrapper(BraveSearchWrapper):
         actual_count = count if count is not None else default_count
         
         # Log search parameters
-        logger.debug(f"BraveAPI: Using parameters - count: {actual_count}, kwargs: {kwargs}")
+        logger.debug("BraveAPI: Using parameters - count: %s, kwargs: %s", actual_count, kwargs)
         
         # Measure API call time
-        start_time = time.time()
+        start_time = time.perf_counter()
         
+        params = {**search_kwargs, **kwargs, "q": query, "count": actual_count}
+        # httpx negotiates gzip/deflate (and br when available) by default
+        headers = {
+            "X-Subscription-Token": self.api_key,
+            "Accept": "application/json",
+        }
+
         try:
-            # Call the API
-            logger.debug(f"BraveAPI: Sending request to Brave Search API")
-            # Don't pass count to super().run() as it doesn't accept it
-            results = super().run(query, **kwargs)
+            # Call the API directly rather than through BraveSearchWrapper.run,
+            # which re-shapes the results and serializes them to a JSON string
+            logger.debug("BraveAPI: Sending request to Brave Search API")
+            response = _client.get(BRAVE_SEARCH_API_URL, params=params, headers=headers)
+            response.raise_for_status()
+            results = orjson.loads(response.content).get("web", {}).get("results", [])
             
-            api_time = time.time() - start_time
-            logger.debug(f"BraveAPI: Request completed in {api_time:.3f} seconds")
+            api_time = time.perf_counter() - start_time
+            logger.debug("BraveAPI: Request completed in %.3f seconds", api_time)
             
             # Log results
-            logger.debug(f"BraveAPI: Received {len(results)} search results")
+            logger.debug("BraveAPI: Received %s search results", len(results))
             
             return results
             
         except Exception as e:
-            logger.error(f"BraveAPI: Request failed with error: {repr(e)}")
+            logger.error("BraveAPI: Request failed with error: %r", e)
             raise
 
 
 class EnhancedBraveSearch(BraveSearch):
     """Enhanced Brave search tool with detailed internal logging."""
 
+    # Whether search_wrapper is our enhanced wrapper; checked once at construction
+    _wrapper_is_enhanced: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        self._wrapper_is_enhanced = isinstance(self.search_wrapper, EnhancedBraveSearchWrapper)
+        if not self._wrapper_is_enhanced:
+            logger.warning("BraveSearch: Not using EnhancedBraveSearchWrapper, logging will be limited")
+
     def _run(
         self,
         query: str,
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> List[Dict]:
         """Run Brave search with detailed logging."""
-        logger.info(f"BraveSearch: Starting search for query: '{query}'")
+        logger.info("BraveSearch: Starting search for query: '%s'", query)
         
         try:
-            # Ensure we're using our enhanced wrapper
-            if not isinstance(self.search_wrapper, EnhancedBraveSearchWrapper):
-                logger.warning("BraveSearch: Not using EnhancedBraveSearchWrapper, logging will be limited")
-            
             # Measure execution time
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # Get search results
-            logger.info(f"BraveSearch: Calling Brave Search API")
+            logger.info("BraveSearch: Calling Brave Search API")
             
             # Check if the wrapper is our enhanced version that supports count
-            if isinstance(self.search_wrapper, EnhancedBraveSearchWrapper):
+            if self._wrapper_is_enhanced:
                 # Pass count parameter to control number of results
-                results = self.search_wrapper.run(query, count=getattr(self, 'k', 10))
+                # (falls back to the wrapper's search_kwargs when unset)
+                results = self.search_wrapper.run(query, count=getattr(self, "k", None))
             else:
                 # Fall back to standard behavior
                 results = self.search_wrapper.run(query)
             
-            api_time = time.time() - start_time
-            logger.info(f"BraveSearch: API call completed in {api_time:.3f} seconds")
+            api_time = time.perf_counter() - start_time
+            logger.info("BraveSearch: API call completed in %.3f seconds", api_time)
             
             # Log number of results
-            logger.info(f"BraveSearch: Received {len(results)} search results")
+            logger.info("BraveSearch: Received %s search results", len(results))
             
             # Process results
             logger.info("BraveSearch: Processing results")
-            start_processing_time = time.time()
+            start_processing_time = time.perf_counter()
             
             # Extract the most relevant results
-            processed_results = []
-            for result in results:
-                processed_results.append({
+            processed_results = [
+                {
                     "title": result.get("title", ""),
                     "link": result.get("url", ""),
                     "snippet": result.get("description", ""),
-                })
-                
-            processing_time = time.time() - start_processing_time
-            logger.info(f"BraveSearch: Results processed in {processing_time:.3f} seconds")
+                }
+                for result in results
+            ]
+
+            processing_time = time.perf_counter() - start_processing_time
+            logger.info("BraveSearch: Results processed in %.3f seconds", processing_time)
             
             return processed_results
             
         except Exception as e:
-            logger.error(f"BraveSearch: Search failed with error: {repr(e)}")
+            logger.error("BraveSearch: Search failed with error: %r", e)
             raise
 
     async def _arun(
@@ -115,11 +144,11 @@ class EnhancedBraveSearch(BraveSearch):
     ) -> List[Dict]:
         """Run Brave search asynchronously with detailed logging."""
         # Note: BraveSearch doesn't have a native async implementation
-        # We're implementing this to maintain consistency with other search tools
-        logger.info(f"BraveSearch (async): Starting search for query: '{query}'")
-        logger.info(f"BraveSearch (async): Note - Using synchronous implementation as async is not natively supported")
+        logger.info("BraveSearch (async): Starting search for query: '%s'", query)
+        logger.info("BraveSearch (async): Note - Running synchronous implementation in a worker thread")
         
-        return self._run(query, run_manager)
+        # Run the blocking Brave HTTP request in a worker thread
+        return await asyncio.to_thread(self._run, query, run_manager)
 
 
 if __name__ == "__main__":
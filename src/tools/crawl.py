@@ -2,36 +2,153 @@
 # SPDX-License-Identifier: MIT
 
 import logging
+import threading
 from typing import Annotated
 
-from langchain_core.tools import tool
+from cachetools import TTLCache
+from langchain_core.tools import StructuredTool
 from .decorators import log_io
 
-from src.crawler import Crawler
+from src.config.tools import CRAWL_CACHE_ENABLED
+from src.crawler import Article, Crawler
 
 logger = logging.getLogger(__name__)
 
+# Agents frequently re-request the same URL; keep recent markdown around so
+# those retries skip the crawl and extraction entirely.
+_cache: TTLCache = TTLCache(maxsize=512, ttl=600)
+_cache_lock = threading.Lock()
+
+_crawler = Crawler()
+
+
+def _cache_get(url: str) -> str | None:
+    if not CRAWL_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        return _cache.get(url)
+
+
+def _cache_put(url: str, markdown_content: str) -> None:
+    if CRAWL_CACHE_ENABLED:
+        with _cache_lock:
+            _cache[url] = markdown_content
+
+
+def _to_markdown(url: str, article: Article) -> str:
+    logger.info(f"Successfully crawled URL: {url}, converting to markdown")
+    markdown_content = article.to_markdown()
+
+    logger.info(f"Markdown conversion complete, content length: {len(markdown_content)} characters")
+    # Return the full markdown content as a string to match the return type annotation
+    return markdown_content
+
 
-@tool
 @log_io
 def crawl_tool(
     url: Annotated[str, "The url to crawl."],
 ) -> str:
     """Use this to crawl a url and get a readable content in markdown format."""
+    if (cached := _cache_get(url)) is not None:
+        logger.info(f"Returning cached content for URL: {url}")
+        return cached
     try:
-        logger.info(f"Initializing crawler for URL: {url}")
-        crawler = Crawler()
-        
         logger.info(f"Starting to crawl URL: {url}")
-        article = crawler.crawl(url)
-        
-        logger.info(f"Successfully crawled URL: {url}, converting to markdown")
-        markdown_content = article.to_markdown()
-        
-        logger.info(f"Markdown conversion complete, content length: {len(markdown_content)} characters")
-        # Return the full markdown content as a string to match the return type annotation
+        article = _crawler.crawl(url)
+
+        markdown_content = _to_markdown(url, article)
+        _cache_put(url, markdown_content)
         return markdown_content
-    except BaseException as e:
+    except Exception as e:
         error_msg = f"Failed to crawl. Error: {repr(e)}"
         logger.error(error_msg)
         return error_msg
+
+
+@log_io
+async def acrawl_tool(
+    url: Annotated[str, "The url to crawl."],
+) -> str:
+    """Use this to crawl a url and get a readable content in markdown format."""
+    if (cached := _cache_get(url)) is not None:
+        logger.info(f"Returning cached content for URL: {url}")
+        return cached
+    try:
+        logger.info(f"Starting to crawl URL: {url}")
+        article = await _crawler.acrawl(url)
+
+        markdown_content = _to_markdown(url, article)
+        _cache_put(url, markdown_content)
+        return markdown_content
+    except Exception as e:
+        error_msg = f"Failed to crawl. Error: {repr(e)}"
+        logger.error(error_msg)
+        return error_msg
+
+
+# Expose both entry points so agents awaiting the tool (ainvoke) run the
+# non-blocking crawl path while sync callers keep working unchanged. The
+# sync function shares the tool's name so its log_io lines keep reading
+# "crawl_tool"; awaited calls log as "acrawl_tool".
+crawl_tool = StructuredTool.from_function(
+    func=crawl_tool,
+    coroutine=acrawl_tool,
+    name="crawl_tool",
+    description="Use this to crawl a url and get a readable content in markdown format.",
+)
+
+
+def _to_markdown_many(articles: dict[str, Article], results: dict[str, str]) -> dict[str, str]:
+    for url, article in articles.items():
+        markdown_content = _to_markdown(url, article)
+        _cache_put(url, markdown_content)
+        results[url] = markdown_content
+    return results
+
+
+@log_io
+def crawl_tool_many(
+    urls: Annotated[list[str], "The urls to crawl."],
+) -> dict[str, str]:
+    """Use this to crawl several urls at once and get their readable content in markdown format, keyed by url."""
+    results = {url: cached for url in urls if (cached := _cache_get(url)) is not None}
+    pending = [url for url in urls if url not in results]
+    if not pending:
+        return results
+    try:
+        logger.info(f"Starting to crawl {len(pending)} URLs")
+        articles = _crawler.crawl_many(pending)
+        return _to_markdown_many(articles, results)
+    except Exception as e:
+        error_msg = f"Failed to crawl. Error: {repr(e)}"
+        logger.error(error_msg)
+        return {**results, **dict.fromkeys(pending, error_msg)}
+
+
+@log_io
+async def acrawl_tool_many(
+    urls: Annotated[list[str], "The urls to crawl."],
+) -> dict[str, str]:
+    """Use this to crawl several urls at once and get their readable content in markdown format, keyed by url."""
+    results = {url: cached for url in urls if (cached := _cache_get(url)) is not None}
+    pending = [url for url in urls if url not in results]
+    if not pending:
+        return results
+    try:
+        logger.info(f"Starting to crawl {len(pending)} URLs")
+        articles = await _crawler.acrawl_many(pending)
+        return _to_markdown_many(articles, results)
+    except Exception as e:
+        error_msg = f"Failed to crawl. Error: {repr(e)}"
+        logger.error(error_msg)
+        return {**results, **dict.fromkeys(pending, error_msg)}
+
+
+# Batched variant: with the crawl4ai crawler all uncached URLs are fetched in
+# a single request instead of one round-trip per URL.
+crawl_tool_many = StructuredTool.from_function(
+    func=crawl_tool_many,
+    coroutine=acrawl_tool_many,
+    name="crawl_tool_many",
+    description="Use this to crawl several urls at once and get their readable content in markdown format, keyed by url.",
+)
@@ -5,12 +5,45 @@ import logging
 import functools
 import inspect
 import time
-from typing import Any, Callable, Type, TypeVar
+from typing import Any, Callable, ClassVar, Type, TypeVar
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Maximum number of characters of a tool result included in the logs
+_RESULT_LOG_LIMIT = 100
+
+
+def _truncate(result: Any) -> str:
+    """Stringify a tool result once and cap it at _RESULT_LOG_LIMIT characters."""
+    result_str = str(result)
+    if len(result_str) > _RESULT_LOG_LIMIT:
+        return result_str[:_RESULT_LOG_LIMIT] + "..."
+    return result_str
+
+
+# Maximum number of characters of a single argument included in the logs
+_ARG_LOG_LIMIT = 200
+
+
+class _LazyParams:
+    """Formats call arguments only when a log record is actually emitted."""
+
+    __slots__ = ("args", "kwargs")
+
+    def __init__(self, args: tuple, kwargs: dict) -> None:
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self) -> str:
+        return ", ".join(
+            [
+                *(str(arg)[:_ARG_LOG_LIMIT] for arg in self.args),
+                *(f"{k}={str(v)[:_ARG_LOG_LIMIT]}" for k, v in self.kwargs.items()),
+            ]
+        )
+
 
 def log_io(func: Callable) -> Callable:
     """
@@ -25,69 +58,96 @@ def log_io(func: Callable) -> Callable:
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        import time
-        
+        # Nothing would consume the timing or the parameters, so skip both
+        if not logger.isEnabledFor(logging.INFO):
+            return func(*args, **kwargs)
+
         # Log input parameters
         func_name = func.__name__
-        params = ", ".join(
-            [*(str(arg) for arg in args), *(f"{k}={v}" for k, v in kwargs.items())]
-        )
-        logger.info(f"Tool {func_name} called with parameters: {params}")
+        _log = logger.info
+        _log("Tool %s called with parameters: %s", func_name, _LazyParams(args, kwargs))
 
         # Execute the function and measure execution time
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        execution_time = time.time() - start_time
+        execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
+
+        # Log the output and execution time
+        _log("Tool %s returned: %s", func_name, _truncate(result))
+        _log("Tool %s execution time: %.3f seconds", func_name, execution_time)
+
+        return result
+
+    @functools.wraps(func)
+    async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not logger.isEnabledFor(logging.INFO):
+            return await func(*args, **kwargs)
+
+        # Log input parameters
+        func_name = func.__name__
+        _log = logger.info
+        _log("Tool %s called with parameters: %s", func_name, _LazyParams(args, kwargs))
+
+        # Execute the function and measure execution time
+        start_ns = time.perf_counter_ns()
+        result = await func(*args, **kwargs)
+        execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
 
         # Log the output and execution time
-        # Limit output to 100 characters
-        result_str = str(result)[:100] + "..." if len(str(result)) > 100 else str(result)
-        logger.info(f"Tool {func_name} returned: {result_str}")
-        logger.info(f"Tool {func_name} execution time: {execution_time:.3f} seconds")
+        _log("Tool %s returned: %s", func_name, _truncate(result))
+        _log("Tool %s execution time: %.3f seconds", func_name, execution_time)
 
         return result
 
+    # Return the appropriate wrapper based on whether the function is async or not
+    if inspect.iscoroutinefunction(func):
+        return async_wrapper
     return wrapper
 
 
 class LoggedToolMixin:
     """A mixin class that adds logging functionality to any tool."""
 
+    # Name of the wrapped tool class used in log lines, set once per class by create_logged_tool
+    _logged_display_name: ClassVar[str]
+
     def _log_operation(self, method_name: str, *args: Any, **kwargs: Any) -> None:
         """Helper method to log tool operations."""
-        tool_name = self.__class__.__name__.replace("Logged", "")
-        params = ", ".join(
-            [*(str(arg) for arg in args), *(f"{k}={v}" for k, v in kwargs.items())]
-        )
-        logger.debug(f"Tool {tool_name}.{method_name} called with parameters: {params}")
+        tool_name = self._logged_display_name
+        params = _LazyParams(args, kwargs)
+        logger.debug("Tool %s.%s called with parameters: %s", tool_name, method_name, params)
 
     def _run(self, *args: Any, **kwargs: Any) -> Any:
         """Override _run method to add logging with execution time."""
-        import time
-        
-        self._log_operation("_run", *args, **kwargs)
-        
         # Filter out 'args' from kwargs if it exists
         filtered_kwargs = {k: v for k, v in kwargs.items() if k != 'args'}
+
+        if not logger.isEnabledFor(logging.DEBUG):
+            return super()._run(*args, **filtered_kwargs)
+
+        self._log_operation("_run", *args, **kwargs)
         
         # Execute the method and measure execution time
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = super()._run(*args, **filtered_kwargs)
-        execution_time = time.time() - start_time
+        execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
         
-        tool_name = self.__class__.__name__.replace('Logged', '')
-        # Limit output to 100 characters
-        result_str = str(result)[:100] + "..." if len(str(result)) > 100 else str(result)
-        logger.debug(f"Tool {tool_name} returned: {result_str}")
-        logger.debug(f"Tool {tool_name} execution time: {execution_time:.3f} seconds")
+        tool_name = self._logged_display_name
+        _log = logger.debug
+        _log("Tool %s returned: %s", tool_name, _truncate(result))
+        _log("Tool %s execution time: %.3f seconds", tool_name, execution_time)
         
         return result
 
 
+@functools.lru_cache(maxsize=None)
 def create_logged_tool(base_tool_class: Type[T]) -> Type[T]:
     """
     Factory function to create a logged version of any tool class.
 
+    Results are memoized per base class, so repeated calls return the same
+    subclass instead of building a new type object every time.
+
     Args:
         base_tool_class: The original tool class to be enhanced with logging
 
@@ -96,7 +156,8 @@ def create_logged_tool(base_tool_class: Type[T]) -> Type[T]:
     """
 
     class LoggedTool(LoggedToolMixin, base_tool_class):
-        pass
+        # ClassVar keeps pydantic from treating it as a private instance attribute
+        _logged_display_name: ClassVar[str] = base_tool_class.__name__
 
     # Set a more descriptive name for the class
     LoggedTool.__name__ = f"Logged{base_tool_class.__name__}"
@@ -123,44 +184,42 @@ def log_mcp_io(server_name: str) -> Callable:
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not logger.isEnabledFor(logging.INFO):
+                return func(*args, **kwargs)
+
             # Log input parameters
             tool_name = func.__name__
-            params = ", ".join(
-                [*(str(arg) for arg in args), *(f"{k}={v}" for k, v in kwargs.items())]
-            )
-            logger.info(f"MCP Tool {tool_name} from server '{server_name}' called with parameters: {params}")
+            _log = logger.info
+            _log("MCP Tool %s from server '%s' called with parameters: %s", tool_name, server_name, _LazyParams(args, kwargs))
             
             # Execute the function and measure execution time
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             result = func(*args, **kwargs)
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
             
             # Log the output and execution time
-            # Limit output to 100 characters
-            result_str = str(result)[:100] + "..." if len(str(result)) > 100 else str(result)
-            logger.info(f"MCP Tool {tool_name} from server '{server_name}' returned: {result_str}")
-            logger.info(f"MCP Tool {tool_name} from server '{server_name}' execution time: {execution_time:.3f} seconds")
+            _log("MCP Tool %s from server '%s' returned: %s", tool_name, server_name, _truncate(result))
+            _log("MCP Tool %s from server '%s' execution time: %.3f seconds", tool_name, server_name, execution_time)
             
             return result
             
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not logger.isEnabledFor(logging.INFO):
+                return await func(*args, **kwargs)
+
             # Log input parameters
             tool_name = func.__name__
-            params = ", ".join(
-                [*(str(arg) for arg in args), *(f"{k}={v}" for k, v in kwargs.items())]
-            )
-            logger.info(f"MCP Tool {tool_name} from server '{server_name}' called with parameters: {params}")
+            _log = logger.info
+            _log("MCP Tool %s from server '%s' called with parameters: %s", tool_name, server_name, _LazyParams(args, kwargs))
             
             # Execute the function and measure execution time
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             result = await func(*args, **kwargs)
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
             
             # Log the output and execution time
-            # Limit output to 100 characters
-            result_str = str(result)[:100] + "..." if len(str(result)) > 100 else str(result)
-            logger.info(f"MCP Tool {tool_name} from server '{server_name}' returned: {result_str}")
-            logger.info(f"MCP Tool {tool_name} from server '{server_name}' execution time: {execution_time:.3f} seconds")
+            _log("MCP Tool %s from server '%s' returned: %s", tool_name, server_name, _truncate(result))
+            _log("MCP Tool %s from server '%s' execution time: %.3f seconds", tool_name, server_name, execution_time)
             
             return result
             
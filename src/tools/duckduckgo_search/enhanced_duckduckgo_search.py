@@ -1,16 +1,23 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Union
 
+import orjson
 from langchain.callbacks.manager import CallbackManagerForToolRun, AsyncCallbackManagerForToolRun
 from langchain_community.tools import DuckDuckGoSearchResults
 
 logger = logging.getLogger(__name__)
 
+# Dedicated pool for blocking DuckDuckGo calls made from the async path, so a
+# burst of searches can't take over the default executor other work relies on
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ddg-search")
+
 
 class EnhancedDuckDuckGoSearchResults(DuckDuckGoSearchResults):
     """Enhanced DuckDuckGo search tool with detailed internal logging."""
@@ -21,20 +28,20 @@ class EnhancedDuckDuckGoSearchResults(DuckDuckGoSearchResults):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> tuple[Union[List[dict], str], List[dict]]:
         """Run DuckDuckGo search with detailed logging."""
-        logger.info(f"DuckDuckGoSearch: Starting search for query: '{query}'")
+        logger.info("DuckDuckGoSearch: Starting search for query: '%s'", query)
         
         try:
-            # Safely access attributes with getattr to prevent AttributeError
-            max_results = getattr(self, "max_results", 10)
-            backend = getattr(self, "backend", "text")
+            # These are declared fields on DuckDuckGoSearchResults, so they always exist
+            max_results = self.max_results
+            backend = self.backend
             
-            logger.info(f"DuckDuckGoSearch: Using parameters - max_results: {max_results}, backend: {backend}")
+            logger.info("DuckDuckGoSearch: Using parameters - max_results: %s, backend: %s", max_results, backend)
             
             # Measure API call time
             start_time = time.time()
             
             # Get search results
-            logger.info(f"DuckDuckGoSearch: Calling DuckDuckGo API")
+            logger.info("DuckDuckGoSearch: Calling DuckDuckGo API")
             raw_results = self.api_wrapper.results(
                 query,
                 max_results,
@@ -42,36 +49,37 @@ class EnhancedDuckDuckGoSearchResults(DuckDuckGoSearchResults):
             )
             
             api_time = time.time() - start_time
-            logger.info(f"DuckDuckGoSearch: API call completed in {api_time:.3f} seconds")
+            logger.info("DuckDuckGoSearch: API call completed in %.3f seconds", api_time)
             
             # Log number of results
-            logger.info(f"DuckDuckGoSearch: Received {len(raw_results)} search results")
+            logger.info("DuckDuckGoSearch: Received %s search results", len(raw_results))
             
             # Process results
             logger.info("DuckDuckGoSearch: Processing and formatting results")
             start_processing_time = time.time()
             
-            # Filter results based on keys_to_include
-            keys_to_include = getattr(self, "keys_to_include", None)
-            results = [
-                {
-                    k: v
-                    for k, v in d.items()
-                    if not keys_to_include or k in keys_to_include
-                }
-                for d in raw_results
-            ]
+            # Filter results based on keys_to_include; a set makes each key check O(1)
+            # and without a filter the raw result dicts are used as they are
+            keys_to_include = self.keys_to_include
+            if keys_to_include:
+                keys = frozenset(keys_to_include)
+                results = [{k: v for k, v in d.items() if k in keys} for d in raw_results]
+            else:
+                results = raw_results
             
-            output_format = getattr(self, "output_format", "string")
-            results_separator = getattr(self, "results_separator", ", ")
+            output_format = self.output_format
+            results_separator = self.results_separator
             
             if output_format == "list":
                 processed_results = results
             elif output_format == "json":
-                processed_results = json.dumps(results)
+                processed_results = orjson.dumps(results).decode()
             elif output_format == "string":
-                res_strs = [", ".join([f"{k}: {v}" for k, v in d.items()]) for d in results]
-                processed_results = results_separator.join(res_strs)
+                # str.join materializes its argument anyway, so list comprehensions
+                # are cheaper here than generator expressions
+                processed_results = results_separator.join(
+                    [", ".join([f"{k}: {v}" for k, v in d.items()]) for d in results]
+                )
             else:
                 raise ValueError(
                     f"Invalid output_format: {output_format}. "
@@ -79,12 +87,12 @@ class EnhancedDuckDuckGoSearchResults(DuckDuckGoSearchResults):
                 )
                 
             processing_time = time.time() - start_processing_time
-            logger.info(f"DuckDuckGoSearch: Results processed in {processing_time:.3f} seconds")
+            logger.info("DuckDuckGoSearch: Results processed in %.3f seconds", processing_time)
             
             return processed_results, raw_results
             
         except Exception as e:
-            logger.error(f"DuckDuckGoSearch: Search failed with error: {repr(e)}")
+            logger.error("DuckDuckGoSearch: Search failed with error: %r", e)
             raise
 
     async def _arun(
@@ -93,12 +101,13 @@ class EnhancedDuckDuckGoSearchResults(DuckDuckGoSearchResults):
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> tuple[Union[List[dict], str], List[dict]]:
         """Run DuckDuckGo search asynchronously with detailed logging."""
-        logger.info(f"DuckDuckGoSearch (async): Starting search for query: '{query}'")
-        logger.info(f"DuckDuckGoSearch (async): Note - Using synchronous implementation as async is not natively supported")
+        logger.info("DuckDuckGoSearch (async): Starting search for query: '%s'", query)
+        logger.info("DuckDuckGoSearch (async): Note - Running synchronous implementation in a worker thread")
         
-        # Call the synchronous implementation
-        # We need to handle the run_manager type mismatch by passing None
-        return self._run(query, None)
+        # Run on the dedicated search pool; the async run_manager can't be
+        # passed to the sync _run, so it gets None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_SEARCH_EXECUTOR, self._run, query, None)
 
 
 if __name__ == "__main__":
@@ -1,42 +1,59 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import importlib
 import json
 import logging
 import os
 
-from langchain_community.tools import BraveSearch, DuckDuckGoSearchResults
-from langchain_community.tools.arxiv import ArxivQueryRun
-from langchain_community.utilities import ArxivAPIWrapper, BraveSearchWrapper
-
 from src.config import SearchEngine, SELECTED_SEARCH_ENGINE
-from src.tools.tavily_search.tavily_search_results_with_images import (
-    TavilySearchResultsWithImages,
-)
-
-# Import enhanced search tools
-from src.tools.duckduckgo_search.enhanced_duckduckgo_search import EnhancedDuckDuckGoSearchResults
-from src.tools.brave_search.enhanced_brave_search import EnhancedBraveSearch, EnhancedBraveSearchWrapper
-from src.tools.arxiv_search.enhanced_arxiv_search import EnhancedArxivQueryRun, EnhancedArxivAPIWrapper
-from src.tools.searxng_search import SearxNGSearchAPIWrapper, get_searxng_search_tool
-
 from src.tools.decorators import create_logged_tool
 
 logger = logging.getLogger(__name__)
-# Create logged versions of the search tools
-LoggedTavilySearch = create_logged_tool(TavilySearchResultsWithImages)
-# Use enhanced versions for the other search tools
-LoggedDuckDuckGoSearch = create_logged_tool(EnhancedDuckDuckGoSearchResults)
-LoggedBraveSearch = create_logged_tool(EnhancedBraveSearch)
-LoggedArxivSearch = create_logged_tool(EnhancedArxivQueryRun)
-# SearxNG search is handled differently through get_searxng_search_tool
+
+# Backends are imported on first use so that only the selected engine's
+# langchain modules are loaded. Maps each logged tool name to the module and
+# class it wraps; SearxNG search is handled differently through
+# get_searxng_search_tool.
+_LOGGED_TOOLS = {
+    "LoggedTavilySearch": (
+        "src.tools.tavily_search.tavily_search_results_with_images",
+        "TavilySearchResultsWithImages",
+    ),
+    # Use enhanced versions for the other search tools
+    "LoggedDuckDuckGoSearch": (
+        "src.tools.duckduckgo_search.enhanced_duckduckgo_search",
+        "EnhancedDuckDuckGoSearchResults",
+    ),
+    "LoggedBraveSearch": (
+        "src.tools.brave_search.enhanced_brave_search",
+        "EnhancedBraveSearch",
+    ),
+    "LoggedArxivSearch": (
+        "src.tools.arxiv_search.enhanced_arxiv_search",
+        "EnhancedArxivQueryRun",
+    ),
+}
+
+
+def _logged_tool(name: str) -> type:
+    """Import a search backend and return its logged tool class."""
+    module_name, class_name = _LOGGED_TOOLS[name]
+    # create_logged_tool is memoized, so every call returns the same class
+    return create_logged_tool(getattr(importlib.import_module(module_name), class_name))
 
 
+def __getattr__(name: str):
+    # Keep `from src.tools.search import LoggedTavilySearch` and friends working
+    if name in _LOGGED_TOOLS:
+        return _logged_tool(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Get the selected search tool
 def get_web_search_tool(max_search_results: int):
     if SELECTED_SEARCH_ENGINE == SearchEngine.TAVILY.value:
-        return LoggedTavilySearch(
+        return _logged_tool("LoggedTavilySearch")(
             name="web_search",
             max_results=max_search_results,
             include_raw_content=True,
@@ -44,9 +61,11 @@ def get_web_search_tool(max_search_results: int):
             include_image_descriptions=True,
         )
     elif SELECTED_SEARCH_ENGINE == SearchEngine.DUCKDUCKGO.value:
-        return LoggedDuckDuckGoSearch(name="web_search", num_results=max_search_results)
+        return _logged_tool("LoggedDuckDuckGoSearch")(name="web_search", num_results=max_search_results)
     elif SELECTED_SEARCH_ENGINE == SearchEngine.BRAVE_SEARCH.value:
-        return LoggedBraveSearch(
+        from src.tools.brave_search.enhanced_brave_search import EnhancedBraveSearchWrapper
+
+        return _logged_tool("LoggedBraveSearch")(
             name="web_search",
             search_wrapper=EnhancedBraveSearchWrapper(
                 api_key=os.getenv("BRAVE_SEARCH_API_KEY", ""),
@@ -54,7 +73,9 @@ def get_web_search_tool(max_search_results: int):
             ),
         )
     elif SELECTED_SEARCH_ENGINE == SearchEngine.ARXIV.value:
-        return LoggedArxivSearch(
+        from src.tools.arxiv_search.enhanced_arxiv_search import EnhancedArxivAPIWrapper
+
+        return _logged_tool("LoggedArxivSearch")(
             name="web_search",
             api_wrapper=EnhancedArxivAPIWrapper(
                 top_k_results=max_search_results,
@@ -65,6 +86,8 @@ def get_web_search_tool(max_search_results: int):
     elif SELECTED_SEARCH_ENGINE == SearchEngine.SEARXNG.value:
         # Use the factory function to get the SearxNG search tool
         from src.config import tools as tools_config
+        from src.tools.searxng_search import get_searxng_search_tool
+
         search_tool = get_searxng_search_tool(tools_config)
         search_tool.name = "web_search"  # Override the default name
         return search_tool
@@ -73,6 +96,13 @@ def get_web_search_tool(max_search_results: int):
 
 
 if __name__ == "__main__":
+    from src.tools.arxiv_search.enhanced_arxiv_search import EnhancedArxivAPIWrapper
+    from src.tools.brave_search.enhanced_brave_search import EnhancedBraveSearchWrapper
+
+    LoggedDuckDuckGoSearch = _logged_tool("LoggedDuckDuckGoSearch")
+    LoggedBraveSearch = _logged_tool("LoggedBraveSearch")
+    LoggedArxivSearch = _logged_tool("LoggedArxivSearch")
+
     # Test each search tool
     print("Testing DuckDuckGo search...")
     results = LoggedDuckDuckGoSearch(
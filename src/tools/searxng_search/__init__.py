@@ -1,6 +1,6 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
-from .enhanced_searxng_search import SearxNGSearchAPIWrapper, get_searxng_search_tool
+from .enhanced_searxng_search import SearxNGSearchAPIWrapper, SearxNGSearchTool, get_searxng_search_tool
 
-__all__ = ["SearxNGSearchAPIWrapper", "get_searxng_search_tool"]
\ No newline at end of file
+__all__ = ["SearxNGSearchAPIWrapper", "SearxNGSearchTool", "get_searxng_search_tool"]
\ No newline at end of file
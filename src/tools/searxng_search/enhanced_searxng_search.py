@@ -1,21 +1,37 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import functools
 import json
 import logging
 import os
 import time
-import asyncio
 from typing import Dict, List, Optional, Any, Tuple
 
+import httpx
+import orjson
 import requests
 from langchain.callbacks.manager import CallbackManagerForToolRun, AsyncCallbackManagerForToolRun
 from langchain_core.tools import BaseTool
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.tools.decorators import create_logged_tool
+from src.utils.http_client import LoopBoundAsyncClient
 
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeouts so a stuck SearxNG instance can't hang the caller
+_REQUEST_TIMEOUT = (3.05, 10)
+
+# Retry transient gateway errors; the last response is still surfaced through
+# raise_for_status rather than as a RetryError
+_RETRY = Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False)
+
+# Same budget for the async path; httpx's transport retries cover connect failures
+_ASYNC_TIMEOUT = httpx.Timeout(10.0, connect=3.05)
+_ASYNC_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+
 
 class SearxNGSearchAPIWrapper:
     """Wrapper for the SearxNG Search API."""
@@ -27,7 +43,19 @@ class SearxNGSearchAPIWrapper:
             searxng_base_url: The base URL of the SearxNG instance.
         """
         self.searxng_base_url = searxng_base_url
-        logger.debug(f"SearxNGAPI: Initialized with base URL: {searxng_base_url}")
+        # Reuse connections across queries instead of a new TCP/TLS handshake each time
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Created lazily for the loop that first needs it
+        self._async_client = LoopBoundAsyncClient(
+            lambda: httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(limits=_ASYNC_LIMITS, retries=2),
+                timeout=_ASYNC_TIMEOUT,
+            )
+        )
+        logger.debug("SearxNGAPI: Initialized with base URL: %s", searxng_base_url)
 
     def results(self, query: str, **kwargs) -> List[Dict]:
         """Get search results from SearxNG API.
@@ -39,7 +67,7 @@ class SearxNGSearchAPIWrapper:
         Returns:
             A list of dictionaries containing search results.
         """
-        logger.debug(f"SearxNGAPI: Preparing request for query: '{query}'")
+        logger.debug("SearxNGAPI: Preparing request for query: '%s'", query)
         
         # Measure API call time
         start_time = time.time()
@@ -50,224 +78,296 @@ class SearxNGSearchAPIWrapper:
         # Add any additional parameters from kwargs
         params.update(kwargs)
         
-        # Construct full request URL for logging
-        request_url = requests.Request('GET', self.searxng_base_url, params=params).prepare().url
-        logger.info(f"Making SearxNG request to: {request_url}")
-        
         # Initialize response variable to avoid unbound variable errors in exception handlers
         response = None
         
         try:
             # Make the request to SearxNG
-            logger.debug(f"SearxNGAPI: Sending request to {self.searxng_base_url}")
-            response = requests.get(self.searxng_base_url, params=params)
+            logger.debug("SearxNGAPI: Sending request to %s", self.searxng_base_url)
+            response = self._session.get(self.searxng_base_url, params=params, timeout=_REQUEST_TIMEOUT)
             
             api_time = time.time() - start_time
-            logger.debug(f"SearxNGAPI: Request completed in {api_time:.3f} seconds with status code {response.status_code}")
-            logger.info(f"SearxNG request to {self.searxng_base_url} returned status: {response.status_code}")
+            logger.debug("SearxNGAPI: Request completed in %.3f seconds with status code %s", api_time, response.status_code)
+            # requests already encoded the full URL, so log that instead of preparing our own copy
+            logger.info("SearxNG request to %s returned status: %s", response.request.url, response.status_code)
             
             # Check if the request was successful
             response.raise_for_status()
             
             # Parse the JSON response
-            data = response.json()
-            logger.debug(f"SearxNGAPI: Successfully parsed JSON response")
-            
-            # Extract the results
-            results = []
-            if "results" in data:
-                num_results = len(data['results'])
-                logger.debug(f"SearxNGAPI: Found {num_results} results")
-                logger.info(f"SearxNG request for query '{query}' returned {num_results} results.")
-                
-                for result in data["results"]:
-                    processed_result = {
-                        "title": result.get("title", ""),
-                        "link": result.get("url", ""),
-                        "snippet": result.get("content", ""),
-                    }
-                    results.append(processed_result)
-            else:
-                logger.warning("SearxNGAPI: No results found in the response")
+            data = orjson.loads(response.content)
+            logger.debug("SearxNGAPI: Successfully parsed JSON response")
             
-            return results
+            return self._extract_results(query, data)
             
+        # Every arm re-raises, and SearxNGSearchTool logs the traceback when it
+        # catches the error, so one plain record per failure is enough here
         except requests.exceptions.HTTPError as e:
-            if response:
-                logger.error(f"SearxNG request failed with status {response.status_code}: {response.text}")
-            logger.error(f"SearxNGAPI: Request failed with error: {repr(e)}")
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("SearxNGAPI: Request failed: %r: %s", e, response.text[:500])
             raise
         except requests.exceptions.RequestException as e:
-            logger.error(f"An error occurred during SearxNG request: {e}")
-            logger.error(f"SearxNGAPI: Request failed with error: {repr(e)}")
+            logger.error("SearxNGAPI: Request failed: %r", e)
             raise
-        except json.JSONDecodeError as e:
-            if response:
-                logger.error(f"Failed to decode JSON from SearxNG response. Error: {e}. Response text: {response.text[:500]}")
-            logger.error(f"SearxNGAPI: Failed to parse JSON response: {repr(e)}")
+        except orjson.JSONDecodeError as e:
+            logger.error("SearxNGAPI: Failed to parse JSON response: %r: %s", e, response.text[:500])
             raise
         except Exception as e:
-            logger.error(f"SearxNGAPI: Unexpected error: {repr(e)}")
+            logger.error("SearxNGAPI: Unexpected error: %r", e)
             raise
 
+    def _extract_results(self, query: str, data: Dict) -> List[Dict]:
+        """Turn a parsed SearxNG response into title/link/snippet dicts."""
+        raw_results = data.get("results")
+        if raw_results is None:
+            logger.warning("SearxNGAPI: No results found in the response")
+            return []
 
-def get_searxng_search_tool(config) -> BaseTool:
-    """Get a SearxNG search tool.
-    
-    Args:
-        config: The configuration object containing the SEARXNG_BASE_URL.
+        num_results = len(raw_results)
+        logger.debug("SearxNGAPI: Found %s results", num_results)
+        logger.info("SearxNG request for query '%s' returned %s results.", query, num_results)
+
+        return [
+            {
+                "title": result.get("title", ""),
+                "link": result.get("url", ""),
+                "snippet": result.get("content", ""),
+            }
+            for result in raw_results
+        ]
+
+    async def aresults(self, query: str, **kwargs) -> List[Dict]:
+        """Get search results from SearxNG API without blocking the event loop.
         
-    Returns:
-        A BaseTool for searching with SearxNG.
-    """
-    searxng_base_url = os.getenv("SEARXNG_BASE_URL", "")
-    
-    if not searxng_base_url:
-        raise ValueError("SEARXNG_BASE_URL environment variable is not set")
-    
-    # Create the SearxNG search wrapper
-    search_wrapper = SearxNGSearchAPIWrapper(searxng_base_url=searxng_base_url)
-    
-    # Create a BaseTool class for SearxNG search
-    class SearxNGSearchTool(BaseTool):
-        name: str = "searxng_search"
-        description: str = "A wrapper around SearxNG. Useful for when you need to answer questions about current events. Input should be a search query."
+        Args:
+            query: The search query.
+            **kwargs: Additional parameters to pass to the SearxNG API.
+        
+        Returns:
+            A list of dictionaries containing search results.
+        """
+        logger.debug("SearxNGAPI (async): Preparing request for query: '%s'", query)
+        
+        # Measure API call time
+        start_time = time.time()
+        
+        params = {"q": query, "format": "json", **kwargs}
         
-        def _extract_query_and_kwargs(self, tool_kwargs: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
-            """Extract query string and additional kwargs from tool input.
+        response = None
+        
+        try:
+            logger.debug("SearxNGAPI (async): Sending request to %s", self.searxng_base_url)
+            client = self._async_client.get()
+            response = await client.get(self.searxng_base_url, params=params)
             
-            Handles three primary input formats:
-            1. {'args': {'query': 'actual_query', 'param1': 'val1'}, ...}
-            2. {'query': 'actual_query', 'param1': 'val1', ...}
-            3. {'args': ['query_string', ...], ...}
+            api_time = time.time() - start_time
+            logger.debug("SearxNGAPI (async): Request completed in %.3f seconds with status code %s", api_time, response.status_code)
+            logger.info("SearxNG request to %s returned status: %s", response.request.url, response.status_code)
             
-            Args:
-                tool_kwargs: The input kwargs dictionary
-                
-            Returns:
-                Tuple of (query_string, api_call_kwargs)
-                
-            Raises:
-                ValueError: If query cannot be extracted from input
-            """
-            query_str: str = ""
-            api_call_kwargs: Dict[str, Any] = {}
-            tool_args = tool_kwargs.get("args")
-            tool_direct_kwargs = tool_kwargs.get("kwargs", {})
+            response.raise_for_status()
+            
+            data = orjson.loads(response.content)
+            logger.debug("SearxNGAPI (async): Successfully parsed JSON response")
+            
+            return self._extract_results(query, data)
+            
+        # Re-raised for SearxNGSearchTool, which logs the traceback
+        except httpx.HTTPStatusError as e:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("SearxNGAPI (async): Request failed: %r: %s", e, e.response.text[:500])
+            raise
+        except httpx.HTTPError as e:
+            logger.error("SearxNGAPI (async): Request failed: %r", e)
+            raise
+        except orjson.JSONDecodeError as e:
+            logger.error("SearxNGAPI (async): Failed to parse JSON response: %r: %s", e, response.text[:500])
+            raise
+        except Exception as e:
+            logger.error("SearxNGAPI (async): Unexpected error: %r", e)
+            raise
+
+    async def aclose(self) -> None:
+        """Close the shared async HTTP client, if one was opened."""
+        await self._async_client.aclose()
+
+
+class SearxNGSearchTool(BaseTool):
+    """Tool that queries a SearxNG instance through a SearxNGSearchAPIWrapper."""
+
+    name: str = "searxng_search"
+    description: str = "A wrapper around SearxNG. Useful for when you need to answer questions about current events. Input should be a search query."
+    search_wrapper: SearxNGSearchAPIWrapper
     
-            if isinstance(tool_args, dict):  # Case 1: args is a dict {'query': '...', ...}
-                if "query" in tool_args:
-                    query_str = str(tool_args["query"])
-                    # Capture other items in args_dict as potential API params
-                    api_call_kwargs.update({k: v for k, v in tool_args.items() if k != "query"})
-                else:
-                    logger.error(f"Missing 'query' in 'args' dictionary: {tool_args}")
-                    raise ValueError("Missing 'query' in 'args' dictionary.")
-            elif isinstance(tool_args, (list, tuple)) and tool_args:  # Case 3: args is a list/tuple ['query_string', ...]
-                query_str = str(tool_args[0])
-                # If there are other positional args, they are not typically used for API kwargs directly
-                # If kwargs were also passed (e.g. tool_kwargs['kwargs']), merge them.
+    def _extract_query_and_kwargs(self, tool_kwargs: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Extract query string and additional kwargs from tool input.
+        
+        Handles three primary input formats:
+        1. {'args': {'query': 'actual_query', 'param1': 'val1'}, ...}
+        2. {'query': 'actual_query', 'param1': 'val1', ...}
+        3. {'args': ['query_string', ...], ...}
+        
+        Args:
+            tool_kwargs: The input kwargs dictionary
+            
+        Returns:
+            Tuple of (query_string, api_call_kwargs)
+            
+        Raises:
+            ValueError: If query cannot be extracted from input
+        """
+        # Fast path for the usual agent call shape, {'query': '...', ...} (Case 2)
+        if "query" in tool_kwargs and tool_kwargs.get("args") is None:
+            query_str = str(tool_kwargs["query"])
+            if query_str:
+                api_call_kwargs = {k: v for k, v in tool_kwargs.items() if k not in ("query", "args", "kwargs")}
+                tool_direct_kwargs = tool_kwargs.get("kwargs")
                 if isinstance(tool_direct_kwargs, dict):
                     api_call_kwargs.update(tool_direct_kwargs)
-            elif "query" in tool_kwargs:  # Case 2: query is a direct key in tool_kwargs
-                query_str = str(tool_kwargs["query"])
-                # Capture other items in tool_kwargs as potential API params
-                api_call_kwargs.update({k: v for k, v in tool_kwargs.items() if k != "query"})
+                logger.debug("Extracted query: '%s', api_call_kwargs: %s from tool_kwargs: %s", query_str, api_call_kwargs, tool_kwargs)
+                return query_str, api_call_kwargs
+
+        query_str = ""
+        api_call_kwargs: Dict[str, Any] = {}
+        tool_args = tool_kwargs.get("args")
+        tool_direct_kwargs = tool_kwargs.get("kwargs", {})
+
+        if isinstance(tool_args, dict):  # Case 1: args is a dict {'query': '...', ...}
+            if "query" in tool_args:
+                query_str = str(tool_args["query"])
+                # Capture other items in args_dict as potential API params
+                api_call_kwargs.update({k: v for k, v in tool_args.items() if k != "query"})
             else:
-                logger.error(f"Could not extract 'query' from tool input: {tool_kwargs}")
-                raise ValueError(f"Could not extract 'query' from tool input: {tool_kwargs}")
-    
-            # Reset api_call_kwargs and rebuild based on where query was found or if a 'kwargs' key exists
-            extracted_api_kwargs = {}
-            if isinstance(tool_args, dict):
-                extracted_api_kwargs = {k: v for k, v in tool_args.items() if k != "query"}
-            elif "query" in tool_kwargs:  # query was a direct key
-                extracted_api_kwargs = {k: v for k, v in tool_kwargs.items() if k != "query" and k not in ["args", "kwargs"]}
-    
-            # Explicitly merge from top-level 'kwargs' if it exists
+                logger.error("Missing 'query' in 'args' dictionary: %s", tool_args)
+                raise ValueError("Missing 'query' in 'args' dictionary.")
+        elif isinstance(tool_args, (list, tuple)) and tool_args:  # Case 3: args is a list/tuple ['query_string', ...]
+            query_str = str(tool_args[0])
+            # If there are other positional args, they are not typically used for API kwargs directly
+            # If kwargs were also passed (e.g. tool_kwargs['kwargs']), merge them.
             if isinstance(tool_direct_kwargs, dict):
-                extracted_api_kwargs.update(tool_direct_kwargs)
+                api_call_kwargs.update(tool_direct_kwargs)
+        elif "query" in tool_kwargs:  # Case 2: query is a direct key in tool_kwargs
+            query_str = str(tool_kwargs["query"])
+            # Capture other items in tool_kwargs as potential API params
+            api_call_kwargs.update({k: v for k, v in tool_kwargs.items() if k != "query"})
+        else:
+            logger.error("Could not extract 'query' from tool input: %s", tool_kwargs)
+            raise ValueError(f"Could not extract 'query' from tool input: {tool_kwargs}")
+
+        # Reset api_call_kwargs and rebuild based on where query was found or if a 'kwargs' key exists
+        extracted_api_kwargs = {}
+        if isinstance(tool_args, dict):
+            extracted_api_kwargs = {k: v for k, v in tool_args.items() if k != "query"}
+        elif "query" in tool_kwargs:  # query was a direct key
+            extracted_api_kwargs = {k: v for k, v in tool_kwargs.items() if k != "query" and k not in ["args", "kwargs"]}
+
+        # Explicitly merge from top-level 'kwargs' if it exists
+        if isinstance(tool_direct_kwargs, dict):
+            extracted_api_kwargs.update(tool_direct_kwargs)
+        
+        api_call_kwargs = extracted_api_kwargs
+
+        if not query_str:
+            logger.error("Could not extract 'query' from tool input: %s", tool_kwargs)
+            raise ValueError(f"Could not extract 'query' from tool input: {tool_kwargs}")
             
-            api_call_kwargs = extracted_api_kwargs
+        logger.debug("Extracted query: '%s', api_call_kwargs: %s from tool_kwargs: %s", query_str, api_call_kwargs, tool_kwargs)
+        return query_str, api_call_kwargs
     
-            if not query_str:
-                logger.error(f"Could not extract 'query' from tool input: {tool_kwargs}")
-                raise ValueError(f"Could not extract 'query' from tool input: {tool_kwargs}")
-                
-            logger.debug(f"Extracted query: '{query_str}', api_call_kwargs: {api_call_kwargs} from tool_kwargs: {tool_kwargs}")
-            return query_str, api_call_kwargs
+    def _run(self, **tool_kwargs: Any) -> str:
+        """Run the SearxNG search tool.
         
-        def _run(self, **tool_kwargs: Any) -> str:
-            """Run the SearxNG search tool.
+        Args:
+            **tool_kwargs: Keyword arguments that may contain query directly or in args dict
             
-            Args:
-                **tool_kwargs: Keyword arguments that may contain query directly or in args dict
-                
-            Returns:
-                JSON string of search results or error message
-            """
-            try:
-                query, api_call_kwargs = self._extract_query_and_kwargs(tool_kwargs)
-                logger.info(f"Executing SearxNG search with query: '{query}' and kwargs: {api_call_kwargs}")
-                
-                raw_results = search_wrapper.results(query=query, **api_call_kwargs)
-                
-                serializable_results: list
-                if isinstance(raw_results, list):
-                    # Just use the raw results directly - they should already be serializable
-                    # If they're not, json.dumps will handle the error
-                    serializable_results = raw_results
-                elif isinstance(raw_results, dict) and 'results' in raw_results and isinstance(raw_results['results'], list):
-                    serializable_results = raw_results['results']
-                else:
-                    logger.warning(f"Unexpected result type from api_wrapper in _run: {type(raw_results)}. Content: {str(raw_results)[:200]}. Returning empty list.")
-                    serializable_results = []
-                    
-                return json.dumps(serializable_results)
-            except ValueError as ve:
-                logger.error(f"ValueError in SearxNGTool _run during argument extraction: {ve} for input {tool_kwargs}")
-                return json.dumps({"error": True, "message": f"Argument extraction failed: {str(ve)}"})
-            except Exception as e:
-                logger.error(f"Exception in SearxNGTool _run: {e} for input {tool_kwargs}", exc_info=True)
-                return json.dumps({"error": True, "message": f"An unexpected error occurred: {str(e)}"})
+        Returns:
+            JSON string of search results or error message
+        """
+        try:
+            query, api_call_kwargs = self._extract_query_and_kwargs(tool_kwargs)
+            logger.info("Executing SearxNG search with query: '%s' and kwargs: %s", query, api_call_kwargs)
             
-        async def _arun(self, **tool_kwargs: Any) -> str:
-            """Run the SearxNG search tool asynchronously.
+            raw_results = self.search_wrapper.results(query=query, **api_call_kwargs)
             
-            Args:
-                **tool_kwargs: Keyword arguments that may contain query directly or in args dict
-                
-            Returns:
-                JSON string of search results or error message
-            """
-            try:
-                query, api_call_kwargs = self._extract_query_and_kwargs(tool_kwargs)
-                logger.info(f"Executing async SearxNG search with query: '{query}' and kwargs: {api_call_kwargs}")
+            serializable_results: list
+            if isinstance(raw_results, list):
+                # Just use the raw results directly - they should already be serializable
+                # If they're not, orjson.dumps will raise and we return an error payload
+                serializable_results = raw_results
+            elif isinstance(raw_results, dict) and 'results' in raw_results and isinstance(raw_results['results'], list):
+                serializable_results = raw_results['results']
+            else:
+                logger.warning("Unexpected result type from api_wrapper in _run: %s. Content: %.200s. Returning empty list.", type(raw_results), raw_results)
+                serializable_results = []
                 
-                raw_results = await asyncio.to_thread(search_wrapper.results, query=query, **api_call_kwargs)
+            return orjson.dumps(serializable_results).decode()
+        except ValueError as ve:
+            logger.error("ValueError in SearxNGTool _run during argument extraction: %s for input %s", ve, tool_kwargs)
+            return orjson.dumps({"error": True, "message": f"Argument extraction failed: {str(ve)}"}).decode()
+        except Exception as e:
+            logger.exception("Exception in SearxNGTool _run: %s for input %s", e, tool_kwargs)
+            return orjson.dumps({"error": True, "message": f"An unexpected error occurred: {str(e)}"}).decode()
+        
+    async def _arun(self, **tool_kwargs: Any) -> str:
+        """Run the SearxNG search tool asynchronously.
+        
+        Args:
+            **tool_kwargs: Keyword arguments that may contain query directly or in args dict
+            
+        Returns:
+            JSON string of search results or error message
+        """
+        try:
+            query, api_call_kwargs = self._extract_query_and_kwargs(tool_kwargs)
+            logger.info("Executing async SearxNG search with query: '%s' and kwargs: %s", query, api_call_kwargs)
+            
+            raw_results = await self.search_wrapper.aresults(query=query, **api_call_kwargs)
+            
+            serializable_results: list
+            if isinstance(raw_results, list):
+                # Just use the raw results directly - they should already be serializable
+                # If they're not, orjson.dumps will raise and we return an error payload
+                serializable_results = raw_results
+            elif isinstance(raw_results, dict) and 'results' in raw_results and isinstance(raw_results['results'], list):
+                serializable_results = raw_results['results']
+            else:
+                logger.warning("Unexpected result type from api_wrapper in _arun: %s. Content: %.200s. Returning empty list.", type(raw_results), raw_results)
+                serializable_results = []
                 
-                serializable_results: list
-                if isinstance(raw_results, list):
-                    # Just use the raw results directly - they should already be serializable
-                    # If they're not, json.dumps will handle the error
-                    serializable_results = raw_results
-                elif isinstance(raw_results, dict) and 'results' in raw_results and isinstance(raw_results['results'], list):
-                    serializable_results = raw_results['results']
-                else:
-                    logger.warning(f"Unexpected result type from api_wrapper in _arun: {type(raw_results)}. Content: {str(raw_results)[:200]}. Returning empty list.")
-                    serializable_results = []
-                    
-                return json.dumps(serializable_results)
-            except ValueError as ve:
-                logger.error(f"ValueError in SearxNGTool _arun during argument extraction: {ve} for input {tool_kwargs}")
-                return json.dumps({"error": True, "message": f"Argument extraction failed: {str(ve)}"})
-            except Exception as e:
-                logger.error(f"Exception in SearxNGTool _arun: {e} for input {tool_kwargs}", exc_info=True)
-                return json.dumps({"error": True, "message": f"An unexpected error occurred: {str(e)}"})
+            return orjson.dumps(serializable_results).decode()
+        except ValueError as ve:
+            logger.error("ValueError in SearxNGTool _arun during argument extraction: %s for input %s", ve, tool_kwargs)
+            return orjson.dumps({"error": True, "message": f"Argument extraction failed: {str(ve)}"}).decode()
+        except Exception as e:
+            logger.exception("Exception in SearxNGTool _arun: %s for input %s", e, tool_kwargs)
+            return orjson.dumps({"error": True, "message": f"An unexpected error occurred: {str(e)}"}).decode()
+
+
+@functools.lru_cache(maxsize=4)
+def _get_searxng_wrapper(searxng_base_url: str) -> SearxNGSearchAPIWrapper:
+    """Return the shared wrapper (and its connection pools) for a SearxNG instance."""
+    return SearxNGSearchAPIWrapper(searxng_base_url=searxng_base_url)
+
+
+def get_searxng_search_tool(config) -> BaseTool:
+    """Get a SearxNG search tool.
+    
+    Args:
+        config: The configuration object containing the SEARXNG_BASE_URL.
+        
+    Returns:
+        A BaseTool for searching with SearxNG.
+    """
+    searxng_base_url = os.getenv("SEARXNG_BASE_URL", "")
+    
+    if not searxng_base_url:
+        raise ValueError("SEARXNG_BASE_URL environment variable is not set")
+    
+    # Reuse the wrapper across calls so its HTTP sessions stay warm between agent turns
+    search_wrapper = _get_searxng_wrapper(searxng_base_url)
     
-    # Create and return the logged tool
+    # Create and return the logged tool; the class itself is memoized by create_logged_tool
     LoggedSearxNGSearchTool = create_logged_tool(SearxNGSearchTool)
-    return LoggedSearxNGSearchTool(name="searxng_search")
+    return LoggedSearxNGSearchTool(name="searxng_search", search_wrapper=search_wrapper)
 
 
 if __name__ == "__main__":
@@ -1,62 +1,255 @@
+import asyncio
+import atexit
 import json
+import logging
+import sys
+import threading
+import time
+from functools import cached_property
 from typing import Dict, List, Optional
 
 import aiohttp
-import requests
+import orjson
+from cachetools import TTLCache
 from langchain_community.utilities.tavily_search import TAVILY_API_URL
 from langchain_community.utilities.tavily_search import (
     TavilySearchAPIWrapper as OriginalTavilySearchAPIWrapper,
 )
 
+from src.config.tools import TAVILY_CACHE_ENABLED
+
+logger = logging.getLogger(__name__)
+
+# Request bodies are pre-encoded with orjson and sent as raw bytes
+_JSON_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+# Upper bound in seconds on a single Tavily request, from either entry point
+_REQUEST_TIMEOUT = 30
+
+# Every Tavily request, sync or async, runs on one background event loop so
+# they all share a single keep-alive aiohttp session and connection pool
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting its daemon thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="tavily-loop", daemon=True).start()
+    return _loop
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use.
+
+    Only called from the background loop, which the session stays bound to.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT),
+            # raw_content bodies compress well; aiohttp decodes br through
+            # the brotli package, which is a direct dependency
+            headers={"Accept-Encoding": "br, gzip"},
+        )
+    return _session
+
+
+async def _fetch(params: Dict) -> bytes:
+    """POST a search request on the background loop and return the raw body."""
+    # Reuse pooled keep-alive connections instead of a new session per query
+    session = _get_session()
+    async with session.post(
+        f"{TAVILY_API_URL}/search", data=orjson.dumps(params), headers=_JSON_HEADERS
+    ) as res:
+        if res.status != 200:
+            error_msg = f"Error {res.status}: {res.reason}"
+            logger.error("TavilyAPI: %s", error_msg)
+            raise Exception(error_msg)
+        # Raw bytes go straight to orjson, skipping a UTF-8 decode to str.
+        # The body is read whole on purpose: the full response is returned
+        # to the tool as its artifact, so every field gets materialized
+        # anyway and a streaming parser would only add per-item overhead.
+        return await res.read()
+
+
+async def _close() -> None:
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+async def close_session() -> None:
+    """Close the shared aiohttp session, if one was opened."""
+    if _loop is not None:
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(_close(), _loop))
+
+
+@atexit.register
+def _shutdown() -> None:
+    """Close the session and stop the background loop at interpreter exit."""
+    if _loop is None or not _loop.is_running():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_close(), _loop).result(timeout=5)
+    except Exception as e:
+        logger.debug("TavilyAPI: Failed to close the shared session: %r", e)
+    finally:
+        _loop.call_soon_threadsafe(_loop.stop)
+
+
+# Agents often reissue the same search within seconds (retries, multi-step
+# reasoning); keep recent raw responses so those skip the network entirely.
+# Entries are the undecoded response bodies, so every hit parses into fresh
+# objects and a caller mutating its result cannot corrupt later hits.
+_cache: TTLCache = TTLCache(maxsize=512, ttl=300)
+_cache_lock = threading.Lock()
+
+
+def _cache_key(params: Dict) -> tuple:
+    """Hashable cache key for a request body, leaving out the API key."""
+    return tuple(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in params.items()
+        if name != "api_key"
+    )
+
+
+def _cache_get(key: tuple) -> Optional[bytes]:
+    if not TAVILY_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        return _cache.get(key)
+
+
+def _cache_put(key: tuple, data: bytes) -> None:
+    if TAVILY_CACHE_ENABLED:
+        with _cache_lock:
+            _cache[key] = data
+
+
+# Shared "type" values of the cleaned results, one object for every dict
+_TYPE_PAGE = sys.intern("page")
+_TYPE_IMAGE = sys.intern("image")
+
+
+def _clean_page(result: Dict) -> Dict:
+    """Build the cleaned dict for one page result."""
+    clean_result = {
+        "type": _TYPE_PAGE,
+        "title": result["title"],
+        "url": result["url"],
+        "content": result["content"],
+        "score": result["score"],
+    }
+    if raw_content := result.get("raw_content"):
+        clean_result["raw_content"] = raw_content
+    return clean_result
+
+
+def _clean_image(image: Dict) -> Dict:
+    """Build the cleaned dict for one image result."""
+    return {
+        "type": _TYPE_IMAGE,
+        "image_url": image["url"],
+        "image_description": image["description"],
+    }
+
 
 class EnhancedTavilySearchAPIWrapper(OriginalTavilySearchAPIWrapper):
-    def raw_results(
+    @cached_property
+    def _api_key(self) -> str:
+        """The unwrapped API key, read from the SecretStr once per wrapper."""
+        return self.tavily_api_key.get_secret_value()
+
+    def _build_params(
         self,
         query: str,
-        max_results: Optional[int] = 5,
-        search_depth: Optional[str] = "advanced",
-        include_domains: Optional[List[str]] = [],
-        exclude_domains: Optional[List[str]] = [],
-        include_answer: Optional[bool] = False,
-        include_raw_content: Optional[bool] = False,
-        include_images: Optional[bool] = False,
-        include_image_descriptions: Optional[bool] = False,
+        max_results: Optional[int],
+        search_depth: Optional[str],
+        include_domains: Optional[List[str]],
+        exclude_domains: Optional[List[str]],
+        include_answer: Optional[bool],
+        include_raw_content: Optional[bool],
+        include_images: Optional[bool],
+        include_image_descriptions: Optional[bool],
     ) -> Dict:
-        import logging
-        import time
-        
-        logger = logging.getLogger(__name__)
-        logger.debug(f"TavilyAPI: Preparing request parameters for query: '{query}'")
-        
+        """Build the request body shared by the sync and async search calls."""
         params = {
-            "api_key": self.tavily_api_key.get_secret_value(),
+            "api_key": self._api_key,
             "query": query,
             "max_results": max_results,
             "search_depth": search_depth,
-            "include_domains": include_domains,
-            "exclude_domains": exclude_domains,
             "include_answer": include_answer,
             "include_raw_content": include_raw_content,
             "include_images": include_images,
             "include_image_descriptions": include_image_descriptions,
         }
+        # Empty domain filters are the API default, so leave them out of the body
+        if include_domains:
+            params["include_domains"] = include_domains
+        if exclude_domains:
+            params["exclude_domains"] = exclude_domains
+        return params
+
+    def raw_results(
+        self,
+        query: str,
+        max_results: Optional[int] = 5,
+        search_depth: Optional[str] = "advanced",
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None,
+        include_answer: Optional[bool] = False,
+        include_raw_content: Optional[bool] = False,
+        include_images: Optional[bool] = False,
+        include_image_descriptions: Optional[bool] = False,
+    ) -> Dict:
+        # Timing and its log lines only matter when DEBUG output is enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        logger.debug("TavilyAPI: Preparing request parameters for query: '%s'", query)
         
-        logger.debug(f"TavilyAPI: Sending POST request to {TAVILY_API_URL}/search")
-        start_time = time.time()
-        
-        response = requests.post(
-            # type: ignore
-            f"{TAVILY_API_URL}/search",
-            json=params,
+        params = self._build_params(
+            query,
+            max_results,
+            search_depth,
+            include_domains,
+            exclude_domains,
+            include_answer,
+            include_raw_content,
+            include_images,
+            include_image_descriptions,
         )
+        cache_key = _cache_key(params)
+        if (cached := _cache_get(cache_key)) is not None:
+            logger.debug("TavilyAPI: Returning cached results for query: '%s'", query)
+            return orjson.loads(cached)
+        
+        logger.debug("TavilyAPI: Sending POST request to %s/search", TAVILY_API_URL)
+        if debug:
+            start_time = time.perf_counter()
+        
+        # Block on the shared background loop rather than a separate sync client.
+        # The explicit timeout also covers a wedged loop, which ClientTimeout cannot.
+        future = asyncio.run_coroutine_threadsafe(_fetch(params), _get_loop())
+        try:
+            data = future.result(timeout=_REQUEST_TIMEOUT)
+        except TimeoutError:
+            future.cancel()
+            raise
         
-        request_time = time.time() - start_time
-        logger.debug(f"TavilyAPI: Request completed in {request_time:.3f} seconds with status code {response.status_code}")
+        if debug:
+            logger.debug("TavilyAPI: Request completed in %.3f seconds", time.perf_counter() - start_time)
         
-        response.raise_for_status()
-        result = response.json()
+        result = orjson.loads(data)
+        _cache_put(cache_key, data)
         
-        logger.debug(f"TavilyAPI: Successfully parsed JSON response")
+        logger.debug("TavilyAPI: Successfully parsed JSON response")
         return result
 
     async def raw_results_async(
@@ -64,110 +257,81 @@ class EnhancedTavilySearchAPIWrapper(OriginalTavilySearchAPIWrapper):
         query: str,
         max_results: Optional[int] = 5,
         search_depth: Optional[str] = "advanced",
-        include_domains: Optional[List[str]] = [],
-        exclude_domains: Optional[List[str]] = [],
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None,
         include_answer: Optional[bool] = False,
         include_raw_content: Optional[bool] = False,
         include_images: Optional[bool] = False,
         include_image_descriptions: Optional[bool] = False,
     ) -> Dict:
         """Get results from the Tavily Search API asynchronously."""
-        import logging
-        import time
+        debug = logger.isEnabledFor(logging.DEBUG)
+        logger.debug("TavilyAPI (async): Preparing request parameters for query: '%s'", query)
+
+        params = self._build_params(
+            query,
+            max_results,
+            search_depth,
+            include_domains,
+            exclude_domains,
+            include_answer,
+            include_raw_content,
+            include_images,
+            include_image_descriptions,
+        )
+        cache_key = _cache_key(params)
+        if (cached := _cache_get(cache_key)) is not None:
+            logger.debug("TavilyAPI (async): Returning cached results for query: '%s'", query)
+            return orjson.loads(cached)
         
-        logger = logging.getLogger(__name__)
-        logger.debug(f"TavilyAPI (async): Preparing request parameters for query: '{query}'")
-
-        # Function to perform the API call
-        async def fetch() -> str:
-            params = {
-                "api_key": self.tavily_api_key.get_secret_value(),
-                "query": query,
-                "max_results": max_results,
-                "search_depth": search_depth,
-                "include_domains": include_domains,
-                "exclude_domains": exclude_domains,
-                "include_answer": include_answer,
-                "include_raw_content": include_raw_content,
-                "include_images": include_images,
-                "include_image_descriptions": include_image_descriptions,
-            }
-            
-            logger.debug(f"TavilyAPI (async): Creating aiohttp session")
-            start_time = time.time()
-            
-            async with aiohttp.ClientSession() as session:
-                logger.debug(f"TavilyAPI (async): Sending POST request to {TAVILY_API_URL}/search")
-                async with session.post(f"{TAVILY_API_URL}/search", json=params) as res:
-                    request_time = time.time() - start_time
-                    logger.debug(f"TavilyAPI (async): Request completed in {request_time:.3f} seconds with status code {res.status}")
-                    
-                    if res.status == 200:
-                        logger.debug(f"TavilyAPI (async): Reading response text")
-                        data = await res.text()
-                        return data
-                    else:
-                        error_msg = f"Error {res.status}: {res.reason}"
-                        logger.error(f"TavilyAPI (async): {error_msg}")
-                        raise Exception(error_msg)
-
-        logger.debug(f"TavilyAPI (async): Executing fetch operation")
-        start_time = time.time()
-        results_json_str = await fetch()
-        fetch_time = time.time() - start_time
-        logger.debug(f"TavilyAPI (async): Fetch completed in {fetch_time:.3f} seconds")
+        if debug:
+            start_time = time.perf_counter()
         
-        logger.debug(f"TavilyAPI (async): Parsing JSON response")
-        result = json.loads(results_json_str)
-        logger.debug(f"TavilyAPI (async): Successfully parsed JSON response")
+        logger.debug("TavilyAPI (async): Sending POST request to %s/search", TAVILY_API_URL)
+        data = await asyncio.wait_for(
+            asyncio.wrap_future(asyncio.run_coroutine_threadsafe(_fetch(params), _get_loop())),
+            _REQUEST_TIMEOUT,
+        )
+        
+        if debug:
+            logger.debug("TavilyAPI (async): Fetch completed in %.3f seconds", time.perf_counter() - start_time)
+        
+        logger.debug("TavilyAPI (async): Parsing JSON response")
+        result = orjson.loads(data)
+        logger.debug("TavilyAPI (async): Successfully parsed JSON response")
+        _cache_put(cache_key, data)
         
         return result
 
+    async def raw_results_many_async(self, queries: List[str], **kwargs) -> List[Dict]:
+        """Get results for several queries concurrently over the shared session.
+
+        Accepts the same keyword arguments as ``raw_results_async`` and returns
+        one raw result dict per query, in order.
+        """
+        return await asyncio.gather(
+            *(self.raw_results_async(query, **kwargs) for query in queries)
+        )
+
     def clean_results_with_images(
         self, raw_results: Dict[str, List[Dict]]
     ) -> List[Dict]:
         """Clean results from Tavily Search API."""
-        import logging
-        import time
-        
-        logger = logging.getLogger(__name__)
+        debug = logger.isEnabledFor(logging.DEBUG)
         logger.debug("TavilyAPI: Starting to clean and process search results")
-        start_time = time.time()
+        if debug:
+            start_time = time.perf_counter()
         
-        # Process page results
         results = raw_results["results"]
-        logger.debug(f"TavilyAPI: Processing {len(results)} page results")
+        images = raw_results.get("images") or ()
+        logger.debug("TavilyAPI: Processing %s page results and %s image results", len(results), len(images))
         
-        clean_results = []
-        for i, result in enumerate(results):
-            clean_result = {
-                "type": "page",
-                "title": result["title"],
-                "url": result["url"],
-                "content": result["content"],
-                "score": result["score"],
-            }
-            if raw_content := result.get("raw_content"):
-                clean_result["raw_content"] = raw_content
-            clean_results.append(clean_result)
-            
-        # Process image results if available
-        images = raw_results.get("images", [])
-        if images:
-            logger.debug(f"TavilyAPI: Processing {len(images)} image results")
-            for image in images:
-                clean_result = {
-                    "type": "image",
-                    "image_url": image["url"],
-                    "image_description": image["description"],
-                }
-                clean_results.append(clean_result)
-        else:
-            logger.debug("TavilyAPI: No image results to process")
+        # Pages then images in a single list build, with map driving both loops
+        clean_results = [*map(_clean_page, results), *map(_clean_image, images)]
             
-        processing_time = time.time() - start_time
-        logger.debug(f"TavilyAPI: Results cleaning completed in {processing_time:.3f} seconds")
-        logger.debug(f"TavilyAPI: Returning {len(clean_results)} total results (pages + images)")
+        if debug:
+            logger.debug("TavilyAPI: Results cleaning completed in %.3f seconds", time.perf_counter() - start_time)
+            logger.debug("TavilyAPI: Returning %s total results (pages + images)", len(clean_results))
         
         return clean_results
 
@@ -1,6 +1,8 @@
-import json
+import logging
+import time
 from typing import Dict, List, Optional, Tuple, Union
 
+import orjson
 from langchain.callbacks.manager import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
@@ -12,6 +14,8 @@ from src.tools.tavily_search.tavily_search_api_wrapper import (
     EnhancedTavilySearchAPIWrapper,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class TavilySearchResultsWithImages(TavilySearchResults):  # type: ignore[override, override]
     """Tool that queries the Tavily Search API and gets back json.
@@ -104,16 +108,14 @@ class TavilySearchResultsWithImages(TavilySearchResults):  # type: ignore[overri
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> Tuple[Union[List[Dict[str, str]], str], Dict]:
         """Use the tool."""
-        import logging
-        import time
-        
-        logger = logging.getLogger(__name__)
-        logger.info(f"TavilySearch: Starting search for query: '{query}'")
+        info = logger.isEnabledFor(logging.INFO)
+        logger.info("TavilySearch: Starting search for query: '%s'", query)
         
         # TODO: remove try/except, should be handled by BaseTool
         try:
-            logger.info(f"TavilySearch: Calling Tavily API with query: '{query}', max_results: {self.max_results}")
-            start_time = time.time()
+            logger.info("TavilySearch: Calling Tavily API with query: '%s', max_results: %s", query, self.max_results)
+            if info:
+                start_time = time.perf_counter()
             
             raw_results = self.api_wrapper.raw_results(
                 query,
@@ -127,25 +129,27 @@ class TavilySearchResultsWithImages(TavilySearchResults):  # type: ignore[overri
                 self.include_image_descriptions,
             )
             
-            api_time = time.time() - start_time
-            logger.info(f"TavilySearch: API call completed in {api_time:.3f} seconds")
-            
-            if "results" in raw_results:
-                logger.info(f"TavilySearch: Received {len(raw_results['results'])} search results")
-            if "images" in raw_results and raw_results["images"]:
-                logger.info(f"TavilySearch: Received {len(raw_results['images'])} images")
+            if info:
+                logger.info("TavilySearch: API call completed in %.3f seconds", time.perf_counter() - start_time)
+                
+                if "results" in raw_results:
+                    logger.info("TavilySearch: Received %s search results", len(raw_results["results"]))
+                if raw_results.get("images"):
+                    logger.info("TavilySearch: Received %s images", len(raw_results["images"]))
                 
         except Exception as e:
-            logger.error(f"TavilySearch: API call failed with error: {repr(e)}")
+            logger.error("TavilySearch: API call failed with error: %r", e)
             return repr(e), {}
             
         logger.info("TavilySearch: Processing and cleaning results")
-        start_time = time.time()
+        if info:
+            start_time = time.perf_counter()
         cleaned_results = self.api_wrapper.clean_results_with_images(raw_results)
-        processing_time = time.time() - start_time
-        logger.info(f"TavilySearch: Results processed in {processing_time:.3f} seconds")
+        if info:
+            logger.info("TavilySearch: Results processed in %.3f seconds", time.perf_counter() - start_time)
         
-        print("sync", json.dumps(cleaned_results, indent=2, ensure_ascii=False))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("TavilySearch: sync cleaned_results: %s", orjson.dumps(cleaned_results).decode())
         return cleaned_results, raw_results
 
     async def _arun(
@@ -154,15 +158,13 @@ class TavilySearchResultsWithImages(TavilySearchResults):  # type: ignore[overri
         run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
     ) -> Tuple[Union[List[Dict[str, str]], str], Dict]:
         """Use the tool asynchronously."""
-        import logging
-        import time
-        
-        logger = logging.getLogger(__name__)
-        logger.info(f"TavilySearch (async): Starting search for query: '{query}'")
+        info = logger.isEnabledFor(logging.INFO)
+        logger.info("TavilySearch (async): Starting search for query: '%s'", query)
         
         try:
-            logger.info(f"TavilySearch (async): Calling Tavily API with query: '{query}', max_results: {self.max_results}")
-            start_time = time.time()
+            logger.info("TavilySearch (async): Calling Tavily API with query: '%s', max_results: %s", query, self.max_results)
+            if info:
+                start_time = time.perf_counter()
             
             raw_results = await self.api_wrapper.raw_results_async(
                 query,
@@ -176,23 +178,25 @@ class TavilySearchResultsWithImages(TavilySearchResults):  # type: ignore[overri
                 self.include_image_descriptions,
             )
             
-            api_time = time.time() - start_time
-            logger.info(f"TavilySearch (async): API call completed in {api_time:.3f} seconds")
-            
-            if "results" in raw_results:
-                logger.info(f"TavilySearch (async): Received {len(raw_results['results'])} search results")
-            if "images" in raw_results and raw_results["images"]:
-                logger.info(f"TavilySearch (async): Received {len(raw_results['images'])} images")
+            if info:
+                logger.info("TavilySearch (async): API call completed in %.3f seconds", time.perf_counter() - start_time)
+                
+                if "results" in raw_results:
+                    logger.info("TavilySearch (async): Received %s search results", len(raw_results["results"]))
+                if raw_results.get("images"):
+                    logger.info("TavilySearch (async): Received %s images", len(raw_results["images"]))
                 
         except Exception as e:
-            logger.error(f"TavilySearch (async): API call failed with error: {repr(e)}")
+            logger.error("TavilySearch (async): API call failed with error: %r", e)
             return repr(e), {}
             
         logger.info("TavilySearch (async): Processing and cleaning results")
-        start_time = time.time()
+        if info:
+            start_time = time.perf_counter()
         cleaned_results = self.api_wrapper.clean_results_with_images(raw_results)
-        processing_time = time.time() - start_time
-        logger.info(f"TavilySearch (async): Results processed in {processing_time:.3f} seconds")
+        if info:
+            logger.info("TavilySearch (async): Results processed in %.3f seconds", time.perf_counter() - start_time)
         
-        print("async", json.dumps(cleaned_results, indent=2, ensure_ascii=False))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("TavilySearch: async cleaned_results: %s", orjson.dumps(cleaned_results).decode())
         return cleaned_results, raw_results
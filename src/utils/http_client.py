@@ -0,0 +1,56 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Callable
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class LoopBoundAsyncClient:
+    """Lazily created httpx.AsyncClients, one per running event loop.
+
+    An AsyncClient is bound to the loop it was created on, so every loop that
+    asks for one gets its own. Clients whose loop has stopped or closed are
+    dropped; a client whose loop is still running is never touched, since
+    that loop may still be using it.
+    """
+
+    def __init__(self, factory: Callable[[], httpx.AsyncClient]) -> None:
+        self._factory = factory
+        # Keyed weakly so a garbage-collected loop takes its client with it
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self) -> httpx.AsyncClient:
+        """Return the client for the running loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                self._prune()
+                client = self._clients[loop] = self._factory()
+        return client
+
+    def _prune(self) -> None:
+        stale = [
+            loop for loop in self._clients if loop.is_closed() or not loop.is_running()
+        ]
+        for loop in stale:
+            del self._clients[loop]
+            logger.debug(
+                "Dropping an async HTTP client whose event loop is no longer running"
+            )
+
+    async def aclose(self) -> None:
+        """Close the running loop's client, if one was opened."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
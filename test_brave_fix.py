@@ -3,8 +3,8 @@ from src.tools.brave_search.enhanced_brave_search import EnhancedBraveSearchWrap
 import os
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+# Configure logging; the wrappers' DEBUG output is verbose, so opt in with TAVILY_TEST_DEBUG=1
+logging.basicConfig(level=logging.DEBUG if os.environ.get("TAVILY_TEST_DEBUG") else logging.WARNING)
 
 def test_enhanced_brave_search_wrapper():
     print("Testing EnhancedBraveSearchWrapper...")
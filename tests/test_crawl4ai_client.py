@@ -0,0 +1,101 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import httpx
+import orjson
+import pytest
+
+from src.crawler.crawl4ai_client import Crawl4aiClient
+
+URL = "https://example.com/article"
+
+
+@pytest.fixture
+def client():
+    client = Crawl4aiClient("http://localhost:11235/crawl")
+    yield client
+    client.close()
+
+
+def test_extract_content_top_level(client):
+    assert client._extract_content({"content": "<p>hi</p>"}, URL) == "<p>hi</p>"
+
+
+def test_extract_content_results_by_url(client):
+    response = {
+        "results": {
+            "https://other.com": {"content": "other"},
+            URL: {"content": "mine"},
+        }
+    }
+    assert client._extract_content(response, URL) == "mine"
+
+
+def test_extract_content_results_falls_back_to_first(client):
+    response = {"results": {"https://other.com": {"content": "other"}}}
+    assert client._extract_content(response, URL) == "other"
+
+
+def test_extract_content_list(client):
+    assert (
+        client._extract_content([{"content": "first"}, {"content": "second"}], URL)
+        == "first"
+    )
+
+
+def test_extract_content_unrecognized_structure(client):
+    response = {"status": "ok"}
+    assert orjson.loads(client._extract_content(response, URL)) == response
+
+
+def test_demux_results_by_url_and_list(client):
+    keyed = {
+        "results": {URL: {"content": "mine"}, "https://other.com": {"status": 404}}
+    }
+    assert client._demux_results(keyed) == {
+        URL: "mine",
+        "https://other.com": orjson.dumps({"status": 404}).decode(),
+    }
+
+    listed = {"results": [{"url": URL, "content": "mine"}]}
+    assert client._demux_results(listed) == {URL: "mine"}
+
+
+def _stub_http(client, handler):
+    client._http.close()
+    client._http = httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_crawl_many_falls_back_to_single_crawls(client):
+    other = "https://example.com/other"
+    requests = []
+
+    def handler(request):
+        urls = orjson.loads(request.content)["urls"]
+        requests.append(urls)
+        if len(urls) > 1:
+            # The batch response only covers the first URL
+            return httpx.Response(
+                200, json={"results": [{"url": URL, "content": "mine"}]}
+            )
+        return httpx.Response(200, json={"content": f"single {urls[0]}"})
+
+    _stub_http(client, handler)
+    assert client.crawl_many([URL, other]) == {URL: "mine", other: f"single {other}"}
+    assert requests == [[URL, other], [other]]
+
+
+def test_crawl_many_batch_failure_crawls_each_url(client):
+    other = "https://example.com/other"
+
+    def handler(request):
+        urls = orjson.loads(request.content)["urls"]
+        if len(urls) > 1:
+            return httpx.Response(500)
+        return httpx.Response(200, json={"content": f"single {urls[0]}"})
+
+    _stub_http(client, handler)
+    assert client.crawl_many([URL, other]) == {
+        URL: f"single {URL}",
+        other: f"single {other}",
+    }
@@ -0,0 +1,62 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from src.tools import crawl
+
+URL = "https://example.com/article"
+
+
+class FakeArticle:
+    def __init__(self, url):
+        self.url = url
+
+    def to_markdown(self):
+        return f"# {self.url}"
+
+
+class FakeCrawler:
+    def __init__(self):
+        self.calls = []
+
+    def crawl(self, url):
+        self.calls.append(url)
+        return FakeArticle(url)
+
+    def crawl_many(self, urls):
+        self.calls.extend(urls)
+        return {url: FakeArticle(url) for url in urls}
+
+
+@pytest.fixture
+def crawler(monkeypatch):
+    fake = FakeCrawler()
+    monkeypatch.setattr(crawl, "_crawler", fake)
+    monkeypatch.setattr(crawl, "CRAWL_CACHE_ENABLED", True)
+    crawl._cache.clear()
+    yield fake
+    crawl._cache.clear()
+
+
+def test_repeated_url_is_served_from_cache(crawler):
+    assert crawl.crawl_tool.invoke({"url": URL}) == f"# {URL}"
+    assert crawl.crawl_tool.invoke({"url": URL}) == f"# {URL}"
+    assert crawler.calls == [URL]
+
+
+def test_crawl_many_only_fetches_uncached_urls(crawler):
+    other = "https://example.com/other"
+    crawl.crawl_tool.invoke({"url": URL})
+    assert crawl.crawl_tool_many.invoke({"urls": [URL, other]}) == {
+        URL: f"# {URL}",
+        other: f"# {other}",
+    }
+    assert crawler.calls == [URL, other]
+
+
+def test_cache_disabled(crawler, monkeypatch):
+    monkeypatch.setattr(crawl, "CRAWL_CACHE_ENABLED", False)
+    crawl.crawl_tool.invoke({"url": URL})
+    crawl.crawl_tool.invoke({"url": URL})
+    assert crawler.calls == [URL, URL]
@@ -0,0 +1,63 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import threading
+
+import httpx
+
+from src.utils.http_client import LoopBoundAsyncClient
+
+
+def _make_client():
+    return httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200))
+    )
+
+
+async def _get(helper):
+    return helper.get()
+
+
+async def _request(client):
+    return (await client.get("http://test/")).status_code
+
+
+def test_concurrent_loops_keep_their_own_client():
+    helper = LoopBoundAsyncClient(_make_client)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        background = asyncio.run_coroutine_threadsafe(_get(helper), loop).result()
+        foreground = asyncio.run(_get(helper))
+
+        assert foreground is not background
+        assert not background.is_closed
+        # The background loop's client still works after another loop got one
+        assert (
+            asyncio.run_coroutine_threadsafe(_request(background), loop).result() == 200
+        )
+        assert (
+            asyncio.run_coroutine_threadsafe(_get(helper), loop).result() is background
+        )
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def test_clients_of_finished_loops_are_dropped():
+    helper = LoopBoundAsyncClient(_make_client)
+    first_loop = asyncio.new_event_loop()
+    second_loop = asyncio.new_event_loop()
+    try:
+        first = first_loop.run_until_complete(_get(helper))
+        first_loop.close()
+        second = second_loop.run_until_complete(_get(helper))
+
+        assert second is not first
+        assert first_loop not in helper._clients
+        assert helper._clients[second_loop] is second
+    finally:
+        second_loop.close()
@@ -0,0 +1,56 @@
+# Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
+# SPDX-License-Identifier: MIT
+
+import asyncio
+
+import orjson
+import pytest
+
+from src.tools.tavily_search import tavily_search_api_wrapper as tavily
+
+RESPONSE = {"results": [{"title": "t", "url": "u", "content": "c", "score": 1.0}]}
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    calls = []
+
+    async def fake_fetch(params):
+        calls.append(params)
+        return orjson.dumps(RESPONSE)
+
+    monkeypatch.setattr(tavily, "_fetch", fake_fetch)
+    monkeypatch.setattr(tavily, "TAVILY_CACHE_ENABLED", True)
+    tavily._cache.clear()
+    yield calls
+    tavily._cache.clear()
+
+
+@pytest.fixture
+def wrapper():
+    return tavily.EnhancedTavilySearchAPIWrapper(tavily_api_key="test-key")
+
+
+def test_repeated_query_is_served_from_cache(fetches, wrapper):
+    assert wrapper.raw_results("panda") == RESPONSE
+    assert asyncio.run(wrapper.raw_results_async("panda")) == RESPONSE
+    assert len(fetches) == 1
+
+
+def test_different_options_miss_the_cache(fetches, wrapper):
+    wrapper.raw_results("panda")
+    wrapper.raw_results("panda", include_domains=["example.com"])
+    wrapper.raw_results("koala")
+    assert len(fetches) == 3
+
+
+def test_cache_hit_returns_a_fresh_result(fetches, wrapper):
+    wrapper.raw_results("panda")["results"].clear()
+    assert wrapper.raw_results("panda") == RESPONSE
+
+
+def test_cache_disabled(fetches, wrapper, monkeypatch):
+    monkeypatch.setattr(tavily, "TAVILY_CACHE_ENABLED", False)
+    wrapper.raw_results("panda")
+    wrapper.raw_results("panda")
+    assert len(fetches) == 2